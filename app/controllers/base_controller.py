@@ -1,18 +1,18 @@
-from fastapi.responses import JSONResponse
+from core.interface.response import FastJSONResponse
 
 class BaseController:
 
     def index ( self ):
-        return JSONResponse({'status': True, 'items': []})
+        return FastJSONResponse({'status': True, 'items': []})
 
     def store ( self ):
-        return JSONResponse({'status': True, 'item': {}})
+        return FastJSONResponse({'status': True, 'item': {}})
 
     def show ( self, id: int ):
-        return JSONResponse({'status': True, 'item': {}})
+        return FastJSONResponse({'status': True, 'item': {}})
 
     def update ( self, id: int ):
-        return JSONResponse({'status': True, 'item': {}})
+        return FastJSONResponse({'status': True, 'item': {}})
 
     def destroy ( self, id: int ):
-        return JSONResponse({'status': True})
+        return FastJSONResponse({'status': True})
@@ -1,6 +1,6 @@
 from fastapi import HTTPException
 
-def dependency():
+def dependency(request = None):
     user = {"id": 1, "role": "admin"}
     if not user:
         raise HTTPException(status_code = 401, detail = "Unauthorized")
@@ -0,0 +1,54 @@
+from . import suite
+import sys, json, argparse
+
+def main ( argv: list = None ):
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub    = parser.add_subparsers(dest="command")
+
+    run = sub.add_parser("run")
+    run.add_argument("--target", choices=list(suite.TARGETS), default="fastapi")
+    run.add_argument("--scenarios", nargs="*", default=None)
+    run.add_argument("--connections", type=int, default=64)
+    run.add_argument("--duration", type=float, default=10)
+    run.add_argument("--pipeline", type=int, default=1)
+    run.add_argument("--warmup", type=float, default=1)
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--port", type=int, default=8765)
+    run.add_argument("--output", default=None)
+
+    cmp = sub.add_parser("compare")
+    cmp.add_argument("base")
+    cmp.add_argument("head")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+
+        rows = suite.compare(suite.load(args.base), suite.load(args.head))
+
+        print(f"{'scenario':<10} {'rps before':>12} {'rps after':>12} {'change':>9} {'p99 before':>12} {'p99 after':>12}")
+        for r in rows: print(f"{r['scenario']:<10} {r['rps_before']:>12,.1f} {r['rps_after']:>12,.1f} {r['rps_change']:>8.2f}% {r['p99_before']:>10,.1f}us {r['p99_after']:>10,.1f}us")
+
+        return rows
+
+    if args.command != "run": args = run.parse_args(argv or [])
+
+    result = suite.run(
+        target      = args.target,
+        scenarios   = args.scenarios,
+        port        = args.port,
+        workers     = args.workers,
+        warmup      = args.warmup,
+        connections = args.connections,
+        duration    = args.duration,
+        pipeline    = args.pipeline,
+    )
+
+    if args.output: suite.save(args.output, result)
+    else: json.dump(result, sys.stdout, indent=2)
+
+    return result
+
+if __name__ == "__main__":
+    main()
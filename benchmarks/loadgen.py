@@ -0,0 +1,131 @@
+from typing import Any
+from core.support.utils.setup.probe import read_response
+import asyncio, bisect, time
+
+BUCKETS = [b * m for m in (1, 10, 100, 1000, 10000) for b in (10, 20, 30, 50, 70)] + [1_000_000]
+
+class Histogram:
+
+    def __init__ ( self ):
+
+        self.counts  = [0] * (len(BUCKETS) + 1)
+        self.samples = []
+        self.total   = 0.0
+        self.max     = 0.0
+
+    def add ( self, seconds: float ):
+
+        us = seconds * 1e6
+
+        self.counts[bisect.bisect_left(BUCKETS, us)] += 1
+        self.samples.append(us)
+        self.total += us
+        self.max = max(self.max, us)
+
+    def merge ( self, other: "Histogram" ):
+
+        self.counts  = [a + b for a, b in zip(self.counts, other.counts)]
+        self.samples += other.samples
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+        return self
+
+    def percentile ( self, data: list, q: float ):
+
+        if not data: return 0.0
+        return data[min(len(data) - 1, int(q * len(data)))]
+
+    def to_dict ( self ):
+
+        data = sorted(self.samples)
+        size = len(data)
+
+        return {
+            "count"   : size,
+            "mean_us" : round(self.total / size, 1) if size else 0.0,
+            "p50_us"  : round(self.percentile(data, 0.50), 1),
+            "p90_us"  : round(self.percentile(data, 0.90), 1),
+            "p99_us"  : round(self.percentile(data, 0.99), 1),
+            "p999_us" : round(self.percentile(data, 0.999), 1),
+            "max_us"  : round(self.max, 1),
+            "buckets" : { f"<={b}us" if i < len(BUCKETS) else f">{BUCKETS[-1]}us": c for i, (b, c) in enumerate(zip(BUCKETS + [BUCKETS[-1]], self.counts)) if c },
+        }
+
+async def connection ( host: str, port: int, request: bytes, pipeline: int, deadline: float, stats: dict, expect: tuple ):
+
+    histogram = Histogram()
+    reader, writer = None, None
+    batch = request * pipeline
+
+    while time.perf_counter() < deadline:
+
+        try:
+
+            if writer is None: reader, writer = await asyncio.open_connection(host, port)
+
+            start = time.perf_counter()
+            writer.write(batch)
+            await writer.drain()
+
+            for _ in range(pipeline):
+
+                status, close = await read_response(reader)
+                histogram.add(time.perf_counter() - start)
+                stats["status"][status] = stats["status"].get(status, 0) + 1
+
+                if status not in expect: stats["unexpected"] += 1
+
+                if close:
+                    writer.close()
+                    writer = None
+                    break
+
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+
+            stats["errors"] += 1
+            if writer is not None: writer.close()
+            writer = None
+
+            await asyncio.sleep(0.001)
+
+    if writer is not None: writer.close()
+    return histogram
+
+def build_request ( host: str, port: int, path: str, method: str = "GET", headers: dict = None, body: bytes = b"" ):
+
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {host}:{port}", "Connection: keep-alive"]
+    lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+
+    if body: lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+async def arun ( host: str, port: int, path: str, connections: int = 64, duration: float = 10, pipeline: int = 1, expect: tuple = (200,), **request: Any ):
+
+    stats    = {"status": {}, "errors": 0, "unexpected": 0}
+    payload  = build_request(host, port, path, **request)
+    started  = time.perf_counter()
+    deadline = started + duration
+
+    results  = await asyncio.gather(*[connection(host, port, payload, max(1, pipeline), deadline, stats, tuple(expect)) for _ in range(connections)])
+    elapsed  = time.perf_counter() - started
+    merged   = Histogram()
+
+    for h in results: merged.merge(h)
+
+    return {
+        "path"        : path,
+        "connections" : connections,
+        "duration"    : round(elapsed, 3),
+        "pipeline"    : pipeline,
+        "requests"    : len(merged.samples),
+        "rps"         : round(len(merged.samples) / elapsed, 1) if elapsed else 0.0,
+        "errors"      : stats["errors"] + stats["unexpected"],
+        "unexpected"  : stats["unexpected"],
+        "status"      : { str(k): v for k, v in sorted(stats["status"].items()) },
+        "latency"     : merged.to_dict(),
+    }
+
+def run ( host: str, port: int, path: str, **options: Any ):
+
+    return asyncio.run(arun(host, port, path, **options))
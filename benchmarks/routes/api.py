@@ -0,0 +1,19 @@
+from starlette.responses import PlainTextResponse
+from core.routing import route
+
+def plaintext ():
+    return PlainTextResponse("Hello, World!")
+
+def json ():
+    return {"message": "Hello, World!"}
+
+def post ( id: int, post: int ):
+    return {"user": id, "post": post}
+
+with route.prefix('bench').name('bench'):
+
+    route.get('plaintext', plaintext).name('plaintext')
+    route.get('json', json).name('json')
+    route.get('users/{id}/posts/{post}', post).name('params')
+    route.get('guarded', json).middleware('auth', 'has:view_users').name('guarded')
+    route.get('limited', json).limit(1_000_000_000, 1).name('limited')
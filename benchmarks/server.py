@@ -0,0 +1,38 @@
+from core.support.utils.setup.probe import wait, stop
+import os, sys, argparse, subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def create_app ():
+
+    from core.bootstrap import create_app
+    return create_app(routes="benchmarks.routes")
+
+def command ( target: str, host: str, port: int, workers: int = 1 ):
+
+    if target == "main": return [sys.executable, os.path.join(ROOT, "main.py")]
+    return [sys.executable, "-m", "benchmarks.server", "--host", host, "--port", str(port), "--workers", str(workers)]
+
+def start ( target: str = "fastapi", host: str = "127.0.0.1", port: int = 8765, workers: int = 1, timeout: float = 30 ):
+
+    env = {**os.environ, "APP_ENV": "production", "APP_DEBUG": "false"}
+    process = subprocess.Popen(command(target, host, port, workers), cwd=ROOT, env=env, stdout=subprocess.DEVNULL)
+
+    try: wait(host, port, process, timeout)
+    except BaseException:
+        stop(process)
+        raise
+
+    return process
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    from core.bootstrap.workers import serve
+    from core.support.utils.setup.run import preload_app
+    serve(preload_app(create_app()), host=args.host, port=args.port, workers=args.workers, log_level="warning", access_log=False)
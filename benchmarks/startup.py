@@ -0,0 +1,91 @@
+from typing import Any
+from . import server
+import os, sys, json, time, argparse, tempfile, subprocess, psutil
+
+MODES = {
+    "preload" : lambda host, port, workers: [sys.executable, "-m", "benchmarks.server", "--host", host, "--port", str(port), "--workers", str(workers)],
+    "import"  : lambda host, port, workers: [sys.executable, "-m", "uvicorn", "benchmarks.server:create_app", "--factory", "--host", host, "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+}
+
+def readiness ( path: str ):
+
+    try:
+        with open(path, "r", encoding="utf-8") as f: lines = f.read().split()
+    except OSError:
+        return {}
+
+    return { int(pid): float(ts) for pid, ts in zip(lines[0::2], lines[1::2]) }
+
+def memory ( pid: int ):
+
+    try:
+        info = psutil.Process(pid).memory_full_info()
+        return {"rss": info.rss, "uss": getattr(info, "uss", 0), "pss": getattr(info, "pss", 0)}
+
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return {"rss": 0, "uss": 0, "pss": 0}
+
+def measure ( mode: str, workers: int = 4, host: str = "127.0.0.1", port: int = 8766, timeout: float = 60, settle: float = 1 ):
+
+    fd, log = tempfile.mkstemp(prefix="ready-", suffix=".log")
+    os.close(fd)
+
+    env     = {**os.environ, "APP_READY_LOG": log, "APP_ENV": "production", "APP_DEBUG": "false"}
+    started = time.time()
+    process = subprocess.Popen(MODES[mode](host, port, workers), cwd=server.ROOT, env=env, stdout=subprocess.DEVNULL)
+
+    try:
+
+        deadline = time.monotonic() + timeout
+
+        while len(readiness(log)) < workers:
+            if process.poll() is not None: raise RuntimeError(f"{mode} server exited with code {process.returncode}")
+            if time.monotonic() > deadline: raise TimeoutError(f"{mode} workers not ready after {timeout}s")
+            time.sleep(0.05)
+
+        ready = readiness(log)
+        time.sleep(settle)
+
+        master  = memory(process.pid)
+        workers = { pid: {**memory(pid), "ready_ms": round((ts - started) * 1000, 1)} for pid, ts in ready.items() }
+
+    finally:
+        server.stop(process)
+        os.unlink(log)
+
+    count = len(workers) or 1
+
+    return {
+        "mode"         : mode,
+        "workers"      : len(workers),
+        "ready_ms"     : max(w["ready_ms"] for w in workers.values()),
+        "master_rss"   : master["rss"],
+        "avg_rss"      : sum(w["rss"] for w in workers.values()) // count,
+        "avg_uss"      : sum(w["uss"] for w in workers.values()) // count,
+        "avg_pss"      : sum(w["pss"] for w in workers.values()) // count,
+        "total_pss"    : master["pss"] + sum(w["pss"] for w in workers.values()),
+        "per_worker"   : { str(k): v for k, v in workers.items() },
+    }
+
+def compare ( workers: int = 4, **options: Any ):
+
+    return { mode: measure(mode, workers, **options) for mode in MODES }
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    result = compare(args.workers, port=args.port)
+    mib    = lambda n: f"{n / 1048576:>8.1f} MiB"
+
+    print(f"{'mode':<8} {'ready':>10} {'avg rss':>12} {'avg uss':>12} {'avg pss':>12} {'total pss':>12}", file=sys.stderr)
+    for mode, r in result.items(): print(f"{mode:<8} {r['ready_ms']:>8.1f}ms {mib(r['avg_rss'])} {mib(r['avg_uss'])} {mib(r['avg_pss'])} {mib(r['total_pss'])}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f: json.dump(result, f, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
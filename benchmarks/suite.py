@@ -0,0 +1,108 @@
+from typing import Any
+from . import loadgen, server
+import os, sys, json, time, platform, subprocess
+
+SCENARIOS = {
+    "plaintext" : {"path": "/bench/plaintext"},
+    "json"      : {"path": "/bench/json"},
+    "params"    : {"path": "/bench/users/42/posts/7"},
+    "guarded"   : {"path": "/bench/guarded"},
+    "limited"   : {"path": "/bench/limited"},
+}
+
+TARGETS = {
+    "fastapi" : list(SCENARIOS),
+    "main"    : ["root"],
+}
+
+def scenario ( name: str ):
+
+    return {"path": "/"} if name == "root" else dict(SCENARIOS[name])
+
+def commit ():
+
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=server.ROOT, capture_output=True, text=True, timeout=5)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=server.ROOT, capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "") or None
+
+    except Exception:
+        return None
+
+def environment ():
+
+    return {
+        "commit"    : commit(),
+        "python"    : platform.python_version(),
+        "impl"      : platform.python_implementation(),
+        "platform"  : platform.platform(),
+        "machine"   : platform.machine(),
+        "cpus"      : os.cpu_count(),
+        "timestamp" : time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+def run ( target: str = "fastapi", scenarios: list = None, host: str = "127.0.0.1", port: int = 8765, workers: int = 1, warmup: float = 1, **options: Any ):
+
+    names   = list(scenarios or TARGETS[target])
+    port    = 8000 if target == "main" else port
+    process = server.start(target, host, port, workers)
+    results = {}
+    failed  = []
+
+    try:
+
+        for name in names:
+
+            spec = scenario(name)
+            if warmup: loadgen.run(host, port, **{**spec, **options, "duration": warmup})
+
+            results[name] = loadgen.run(host, port, **{**spec, **options})
+            print(f"{name:<10} {results[name]['rps']:>12,.1f} req/s   p99 {results[name]['latency']['p99_us']:>10,.1f}us   errors {results[name]['errors']}", file=sys.stderr)
+
+            if results[name]['errors']: failed.append(f"{name} ({results[name]['errors']} errors, status {results[name]['status']})")
+
+    finally:
+        server.stop(process)
+
+    if failed: raise RuntimeError("Benchmark scenarios returned errors or unexpected statuses: " + ", ".join(failed))
+
+    return {
+        "env"       : environment(),
+        "target"    : target,
+        "workers"   : workers,
+        "options"   : options,
+        "scenarios" : results,
+    }
+
+def compare ( base: dict, head: dict ):
+
+    rows = []
+
+    for name, after in head.get("scenarios", {}).items():
+
+        before = base.get("scenarios", {}).get(name)
+        if not before: continue
+
+        rps  = (after["rps"] - before["rps"]) / before["rps"] * 100 if before["rps"] else 0.0
+        p99  = after["latency"]["p99_us"] - before["latency"]["p99_us"]
+
+        rows.append({
+            "scenario"   : name,
+            "rps_before" : before["rps"],
+            "rps_after"  : after["rps"],
+            "rps_change" : round(rps, 2),
+            "p99_before" : before["latency"]["p99_us"],
+            "p99_after"  : after["latency"]["p99_us"],
+            "p99_change" : round(p99, 1),
+        })
+
+    return rows
+
+def load ( path: str ):
+
+    with open(path, "r", encoding="utf-8") as f: return json.load(f)
+
+def save ( path: str, data: dict ):
+
+    with open(path, "w", encoding="utf-8") as f: json.dump(data, f, indent=2)
+    return path
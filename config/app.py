@@ -9,4 +9,5 @@ config = {
     'debug'       : env('APP_DEBUG', True),
     'host'        : env('APP_HOST', '127.0.0.1'),
     'port'        : env('APP_PORT', 8000),
+    'workers'     : env('APP_WORKERS', 1),
 }
@@ -1,5 +1,5 @@
-from typing import Callable
-import turbox, os
+from typing import Any, Callable
+import turbox, os, sys, dis, json, time, select, signal, socket, subprocess, importlib.util
 
 class Utils:
     
@@ -11,6 +11,47 @@ class Utils:
         print(turbox.Route())
         print(turbox.Server())
 
+class Static:
+
+    def __init__ ( self, body: Any = b"", status: int = 200, headers: dict = None, content_type: str = "application/json" ):
+
+        self.body    = Static.render(body)
+        self.status  = int(status)
+        self.headers = [(str(k), str(v)) for k, v in {"content-type": content_type, **(headers or {})}.items()]
+
+    @staticmethod
+    def render ( body: Any ):
+
+        if body is None: return b""
+        if isinstance(body, (bytes, bytearray)): return bytes(body)
+        if isinstance(body, str): return body.encode()
+        if isinstance(body, bool): return b"true" if body else b"false"
+
+        return json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode()
+
+    @staticmethod
+    def constant ( handler: Callable ):
+
+        code = getattr(handler, "__code__", None)
+        if code is None or code.co_freevars or handler.__closure__: return None
+
+        ops = [i for i in dis.get_instructions(handler) if i.opname not in ("RESUME", "NOP", "CACHE")]
+
+        if len(ops) == 1 and ops[0].opname == "RETURN_CONST": return (ops[0].argval,)
+        if len(ops) == 2 and ops[0].opname == "LOAD_CONST" and ops[1].opname == "RETURN_VALUE": return (ops[0].argval,)
+
+        return None
+
+    @staticmethod
+    def detect ( handler: Any ):
+
+        if isinstance(handler, Static): return handler
+        if isinstance(handler, (bytes, bytearray, str)): return Static(handler)
+        if not callable(handler): return None
+
+        value = Static.constant(handler)
+        return Static(value[0]) if value else None
+
 class Route:
 
     _router = turbox.Route()
@@ -18,9 +59,18 @@ class Route:
     @staticmethod
     def add ( method: str, path: str, handler: Callable ):
 
-        Route._router.add(method, path, handler)
+        static = Static.detect(handler)
+
+        if static: Route._router.add_static(method, path, static.body, static.status, static.headers)
+        else: Route._router.add(method, path, handler)
+
         return Route
 
+    @staticmethod
+    def static ( method: str, path: str, body: Any = b"", status: int = 200, headers: dict = None, content_type: str = "application/json" ):
+
+        return Route.add(method.upper(), path, Static(body, status, headers, content_type))
+
     @staticmethod
     def get ( path: str, handler: Callable ):
 
@@ -60,6 +110,12 @@ class Server:
     _keep_alive: bool     = True
     _backlog: int         = 16384
     _max_connections: int = 100_000
+    _blocking_threads: int = 0
+    _max_inflight: int    = 0
+    _cpu_affinity: bool   = False
+    _reload: bool         = False
+    _watch: str           = None
+    _drain: int           = 30
 
     @staticmethod
     def bind ( host: str, port: int ):
@@ -76,18 +132,233 @@ class Server:
         return Server
 
     @staticmethod
-    def config ( max_connections: int = 100_000, backlog: int = 16384, keep_alive: bool = True ):
+    def config (
+        max_connections: int = 100_000,
+        backlog: int = 16384,
+        keep_alive: bool = True,
+        blocking_threads: int = 0,
+        max_inflight: int = 0,
+        cpu_affinity: bool = False
+    ):
 
         Server._max_connections = max_connections
         Server._backlog = backlog
         Server._keep_alive = keep_alive
+        Server._blocking_threads = blocking_threads
+        Server._max_inflight = max_inflight
+        Server._cpu_affinity = cpu_affinity
 
         return Server
 
+    @staticmethod
+    def reload ( enabled: bool = True, watch: str = None, drain: int = 30 ):
+
+        Server._reload = enabled
+        Server._watch  = watch
+        Server._drain  = drain
+
+        return Server
+
+    @staticmethod
+    def settings ():
+
+        return {
+            "host"             : Server._host,
+            "port"             : Server._port,
+            "workers"          : Server._workers,
+            "max_connections"  : Server._max_connections,
+            "backlog"          : Server._backlog,
+            "keep_alive"       : Server._keep_alive,
+            "blocking_threads" : Server._blocking_threads,
+            "max_inflight"     : Server._max_inflight,
+            "cpu_affinity"     : Server._cpu_affinity,
+            "reload"           : Server._reload,
+            "watch"            : Server._watch,
+            "drain"            : Server._drain,
+        }
+
+    @staticmethod
+    def validate ():
+
+        s, errors = Server.settings(), []
+
+        if not 0 < int(s["port"]) < 65536: errors.append(f"port must be between 1 and 65535, got {s['port']}")
+        if int(s["workers"]) < 1: errors.append(f"workers must be >= 1, got {s['workers']}")
+        if int(s["backlog"]) < 1: errors.append(f"backlog must be >= 1, got {s['backlog']}")
+        if int(s["max_connections"]) < 1: errors.append(f"max_connections must be >= 1, got {s['max_connections']}")
+
+        for key in ("blocking_threads", "max_inflight"):
+            if int(s[key]) < 0: errors.append(f"{key} must be >= 0, got {s[key]}")
+
+        if s["max_inflight"] and s["max_inflight"] > s["max_connections"]:
+            errors.append(f"max_inflight ({s['max_inflight']}) cannot exceed max_connections ({s['max_connections']})")
+
+        if s["cpu_affinity"] and s["workers"] > (os.cpu_count() or 1):
+            errors.append(f"cpu_affinity needs workers <= {os.cpu_count() or 1} cores, got {s['workers']}")
+
+        if int(s["drain"]) < 0: errors.append(f"drain must be >= 0, got {s['drain']}")
+        if s["watch"] and not os.path.isdir(str(s["watch"])): errors.append(f"watch must be an existing directory, got {s['watch']}")
+
+        if errors: raise ValueError("Invalid server config:\n  " + "\n  ".join(errors))
+        return True
+
+    @staticmethod
+    def summary ():
+
+        settings = Server.settings()
+
+        print(f"{'SETTING':<20} {'VALUE'}")
+        print('-'*40)
+
+        for key, value in settings.items():
+            print(f"{key:<20} {value}")
+
+        print('-'*40)
+        return settings
+
     @staticmethod
     def run ():
 
+        Server.validate()
+
+        if Server._reload and "TURBOX_LISTEN_FD" not in os.environ:
+            Server.summary()
+            return Reloader(Server._host, Server._port, Server._backlog, Server._watch).run()
+
+        if "TURBOX_LISTEN_FD" not in os.environ: Server.summary()
+
         Server._server.bind(Server._host, Server._port)
         Server._server.workers(Server._workers)
         Server._server.config(Server._max_connections, Server._backlog, Server._keep_alive)
+        Server._server.tuning(Server._blocking_threads, Server._max_inflight, Server._cpu_affinity)
+        Server._server.handoff(int(os.environ.get("TURBOX_LISTEN_FD", -1)), int(os.environ.get("TURBOX_READY_FD", -1)), Server._drain)
         Server._server.run()
+
+class Reloader:
+
+    def __init__ ( self, host: str, port: int, backlog: int = 16384, watch: str = None, timeout: float = 30 ):
+
+        self.host      = host
+        self.port      = port
+        self.backlog   = backlog
+        self.watch     = watch
+        self.timeout   = timeout
+        self.sock      = None
+        self.current   = None
+        self.draining  = []
+        self.reloading = False
+        self.stopping  = False
+
+    def bind ( self ):
+
+        self.sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.host, self.port))
+        self.sock.listen(self.backlog)
+        self.sock.set_inheritable(True)
+
+        return self.sock
+
+    def spawn ( self, ready: int = -1 ):
+
+        env  = {**os.environ, "TURBOX_LISTEN_FD": str(self.sock.fileno()), "TURBOX_READY_FD": str(ready)}
+        fds  = (self.sock.fileno(),) + ((ready,) if ready >= 0 else ())
+
+        return subprocess.Popen([sys.executable, *sys.argv], env=env, pass_fds=fds)
+
+    def ready ( self, process: subprocess.Popen, fd: int ):
+
+        deadline = time.monotonic() + self.timeout
+
+        while time.monotonic() < deadline and not self.stopping:
+
+            if process.poll() is not None: return False
+
+            readable, _, _ = select.select([fd], [], [], 0.2)
+            if readable: return bool(os.read(fd, 64).strip())
+
+        return False
+
+    def rollout ( self ):
+
+        read, write = os.pipe()
+        process     = self.spawn(write)
+
+        os.close(write)
+
+        try: ok = self.ready(process, read)
+        finally: os.close(read)
+
+        if not ok:
+            process.terminate()
+            self.draining.append(process)
+            print("Reload aborted: new server failed to become ready, keeping the current one", file=sys.stderr)
+            return False
+
+        self.current.terminate()
+        self.draining.append(self.current)
+        self.current = process
+
+        return True
+
+    def reload ( self, *args ):
+
+        self.reloading = True
+        return self
+
+    def stop ( self, *args ):
+
+        self.stopping = True
+
+        for process in [self.current, *self.draining]:
+            if process and process.poll() is None: process.terminate()
+
+        return self
+
+    def watcher ( self ):
+
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "core", "utils", "fs", "watcher.py")
+        spec = importlib.util.spec_from_file_location("turbox_watcher", path)
+        mod  = importlib.util.module_from_spec(spec)
+
+        spec.loader.exec_module(mod)
+
+        return mod.Watcher(self.watch, lambda event, src, dest=None: str(dest or src).endswith(".py") and self.reload()).start()
+
+    def run ( self ):
+
+        self.bind()
+        self.current = self.spawn()
+
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGHUP, self.reload)
+
+        watcher = None
+
+        try:
+
+            if self.watch: watcher = self.watcher()
+
+            while True:
+
+                self.draining = [p for p in self.draining if p.poll() is None]
+
+                if self.current.poll() is not None:
+                    if self.stopping or self.current.returncode == 0:
+                        if not self.draining: break
+                    else:
+                        self.current = self.spawn()
+
+                if self.reloading and not self.stopping:
+                    self.reloading = False
+                    self.rollout()
+
+                time.sleep(0.1)
+
+        finally:
+            if self.current.poll() is None: self.stop()
+            if watcher: watcher.stop()
+            self.sock.close()
+
+        return self.current.returncode
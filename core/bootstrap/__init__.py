@@ -1,9 +1,21 @@
 from fastapi import FastAPI
-import uvicorn, asyncio
+from contextlib import asynccontextmanager
+import os
 from core.support.utils import *
 from core.routing import route
+from core.interface.response import FastJSONResponse
+from core.support.utils.setup.run import preload_app
+from .workers import serve, announce
 
-def create_app ():
+@asynccontextmanager
+async def lifespan ( app: FastAPI ):
+
+    app.state.ready = True
+    announce()
+    yield
+    app.state.ready = False
+
+def create_app ( routes: str = None ):
 
     config.init()
 
@@ -11,21 +23,22 @@ def create_app ():
         title       = config.get("app.name"),
         version     = '1.0.0',
         description = config.get("app.description"),
+        lifespan    = lifespan,
+        default_response_class = FastJSONResponse,
         # docs_url    = module.find('docs'),
         # redoc_url   = module.find('redoc'),
     )
 
-    asyncio.gather(
-        route.init(app),
-    )
+    route.register(app, path=routes)
 
     return app
 
-def run ():
+def run ( app: FastAPI = None ):
 
-    uvicorn.run(
-        "main:app",
-        host=config.get("app.host", "127.0.0.1"),
-        port=int(config.get("app.port", 8000)),
-        reload=config.is_local()
-    )
+    host    = config.get("app.host", "127.0.0.1")
+    port    = int(config.get("app.port", 8000))
+    workers = int(config.get("app.workers", 1))
+
+    watch   = os.getcwd() if config.is_local() else None
+
+    return serve(preload_app(app or create_app()), host=host, port=port, workers=workers, target="core.bootstrap:create_app", factory=True, watch_path=watch)
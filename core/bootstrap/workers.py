@@ -0,0 +1,283 @@
+from uvicorn.importer import import_from_string
+from typing import Any
+import gc, os, sys, json, time, select, signal, socket, asyncio, traceback, uvicorn
+
+def bind_socket ( host: str, port: int, backlog: int = 2048 ):
+
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock   = socket.socket(family, socket.SOCK_STREAM)
+
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+
+    return sock
+
+def freeze ():
+
+    gc.collect()
+    gc.freeze()
+
+    return gc.get_freeze_count()
+
+def announce ( pid: int = None ):
+
+    path = os.environ.get("APP_READY_LOG")
+    if not path: return False
+
+    with open(path, "a", encoding="utf-8") as f: f.write(f"{pid or os.getpid()} {time.time():.6f}\n")
+    return True
+
+class DrainGate:
+
+    def __init__ ( self, app: Any ):
+
+        self.app     = app
+        self.closing = False
+
+    async def __call__ ( self, scope: dict, receive: Any, send: Any ):
+
+        if not self.closing or scope["type"] != "http": return await self.app(scope, receive, send)
+
+        async def closing ( message: dict ):
+
+            if message["type"] == "http.response.start": message = {**message, "headers": [*message.get("headers", []), (b"connection", b"close")]}
+            await send(message)
+
+        await self.app(scope, receive, closing)
+
+class WorkerServer(uvicorn.Server):
+
+    def __init__ ( self, config: uvicorn.Config, ready_fd: int = None, gate: DrainGate = None, drain: float = 5 ):
+
+        super().__init__(config)
+        self.ready_fd = ready_fd
+        self.gate     = gate
+        self.drain    = drain
+
+    async def startup ( self, sockets: list = None ):
+
+        await super().startup(sockets=sockets)
+
+        if self.ready_fd is None or self.should_exit: return
+
+        try: os.write(self.ready_fd, f"{os.getpid()}\n".encode())
+        except OSError: pass
+        finally: os.close(self.ready_fd)
+
+        self.ready_fd = None
+
+    async def shutdown ( self, sockets: list = None ):
+
+        for server in self.servers: server.close()
+
+        if self.gate is not None:
+
+            self.gate.closing = True
+            deadline = time.monotonic() + self.drain
+
+            while self.server_state.connections and time.monotonic() < deadline: await asyncio.sleep(0.05)
+
+        await super().shutdown(sockets=sockets)
+
+def serve_worker ( app: Any, sock: socket.socket, ready_fd: int = None, drain: float = 5, **options ):
+
+    gate   = DrainGate(app)
+    server = WorkerServer(uvicorn.Config(gate, **options), ready_fd, gate, drain)
+    server.run(sockets=[sock])
+
+    return True
+
+def main ():
+
+    env     = os.environ
+    ready   = env.get("APP_WORKER_READY_FD")
+    options = json.loads(env.get("APP_WORKER_OPTIONS") or "{}")
+    app     = import_from_string(env["APP_WORKER_TARGET"])
+
+    if env.get("APP_WORKER_FACTORY") == "1": app = app()
+
+    return serve_worker(app, socket.socket(fileno=int(env["APP_WORKER_FD"])), int(ready) if ready else None, **options)
+
+class Supervisor:
+
+    def __init__ ( self, app: Any, sock: socket.socket, workers: int = 1, target: str = None, factory: bool = False, timeout: float = 30, **options ):
+
+        self.app       = app
+        self.sock      = sock
+        self.workers   = max(1, workers)
+        self.target    = target
+        self.factory   = factory
+        self.timeout   = timeout
+        self.options   = options
+        self.current   = set()
+        self.pending   = set()
+        self.draining  = set()
+        self.failed    = False
+        self.fresh     = False
+        self.reloading = False
+        self.stopping  = False
+
+    def exec_worker ( self, ready_fd: int = None ):
+
+        env = {
+            **os.environ,
+            "APP_WORKER_TARGET"   : self.target,
+            "APP_WORKER_FACTORY"  : "1" if self.factory else "0",
+            "APP_WORKER_FD"       : str(self.sock.fileno()),
+            "APP_WORKER_READY_FD" : "" if ready_fd is None else str(ready_fd),
+            "APP_WORKER_OPTIONS"  : json.dumps(self.options, default=str),
+        }
+
+        if ready_fd is not None: os.set_inheritable(ready_fd, True)
+        os.execve(sys.executable, [sys.executable, "-c", "from core.bootstrap.workers import main; main()"], env)
+
+    def spawn ( self, ready_fd: int = None ):
+
+        pid = os.fork()
+        if pid: return pid
+
+        code = 1
+
+        try:
+            for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP): signal.signal(sig, signal.SIG_DFL)
+
+            if self.fresh and self.target: self.exec_worker(ready_fd)
+            serve_worker(self.app, self.sock, ready_fd, **self.options)
+            code = 0
+
+        except BaseException:
+            traceback.print_exc()
+
+        finally:
+            os._exit(code)
+
+    def kill ( self, pids: set, sig: int = signal.SIGTERM ):
+
+        for pid in list(pids):
+            try: os.kill(pid, sig)
+            except ProcessLookupError: pass
+
+        return pids
+
+    def reap ( self ):
+
+        while True:
+
+            try: pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError: return False
+
+            if not pid: return True
+
+            if pid in self.pending:
+                self.pending.discard(pid)
+                self.failed = True
+
+            elif pid in self.current:
+                self.current.discard(pid)
+                if not self.stopping and os.waitstatus_to_exitcode(status) != 0: self.current.add(self.spawn())
+
+            self.draining.discard(pid)
+
+    def ready ( self, fd: int ):
+
+        deadline, buffer, seen = time.monotonic() + self.timeout, b"", set()
+
+        while len(seen) < self.workers and time.monotonic() < deadline:
+
+            self.reap()
+            if self.failed or self.stopping: return False
+
+            readable, _, _ = select.select([fd], [], [], 0.2)
+            if not readable: continue
+
+            chunk = os.read(fd, 4096)
+            if not chunk: break
+
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            seen.update(int(line) for line in lines if line.strip())
+
+        return len(seen) >= self.workers
+
+    def rollout ( self ):
+
+        read, write  = os.pipe()
+        previous     = self.fresh
+        self.fresh   = bool(self.target)
+        self.failed  = False
+        self.pending = set(self.spawn(write) for _ in range(self.workers))
+
+        os.close(write)
+
+        try: ok = self.ready(read)
+        finally: os.close(read)
+
+        fresh, self.pending = self.pending, set()
+
+        if not ok:
+            self.fresh = previous
+            self.draining |= self.kill(fresh)
+            print(f"Reload aborted: new workers failed to become ready within {self.timeout}s, keeping {len(self.current)} workers", file=sys.stderr)
+            return False
+
+        old, self.current = self.current, fresh
+        self.draining |= self.kill(old)
+
+        return True
+
+    def reload ( self, *args ):
+
+        self.reloading = True
+        return self
+
+    def stop ( self, *args ):
+
+        self.stopping = True
+        self.kill(self.current | self.pending | self.draining)
+
+        return self
+
+    def run ( self ):
+
+        self.current = set(self.spawn() for _ in range(self.workers))
+
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGHUP, self.reload)
+
+        while self.current or self.draining:
+
+            if not self.reap(): break
+
+            if self.reloading and not self.stopping:
+                self.reloading = False
+                self.rollout()
+
+            time.sleep(0.1)
+
+        return True
+
+def watch ( path: str, supervisor: Supervisor, suffixes: tuple = (".py", ".env") ):
+
+    from core.support.utils.fs.watcher import Watcher
+
+    def changed ( event: str, src: str, dest: str = None ):
+        if str(dest or src).endswith(suffixes): supervisor.reload()
+
+    return Watcher(path, changed).start()
+
+def serve ( app: Any, host: str = "127.0.0.1", port: int = 8000, workers: int = 1, backlog: int = 2048, preload: bool = True, target: str = None, factory: bool = False, watch_path: str = None, timeout: float = 30, **options ):
+
+    if not hasattr(os, "fork"): return uvicorn.run(app, host=host, port=port, backlog=backlog, workers=1, **options)
+    if preload and workers > 1: freeze()
+
+    sock       = bind_socket(host, port, backlog)
+    supervisor = Supervisor(app, sock, workers, target, factory, timeout, **options)
+    watcher    = watch(watch_path, supervisor) if watch_path else None
+
+    try: return supervisor.run()
+    finally:
+        if watcher: watcher.stop()
+        sock.close()
@@ -1,14 +1,79 @@
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
+from typing import Any, Iterable
+import dataclasses, decimal, orjson
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def default ( value: Any ):
+
+    if hasattr(value, "model_dump"): return value.model_dump()
+    if hasattr(value, "dict") and callable(value.dict): return value.dict()
+    if dataclasses.is_dataclass(value): return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset, tuple)): return list(value)
+    if isinstance(value, decimal.Decimal): return float(value)
+    if isinstance(value, (bytes, bytearray)): return value.decode(errors="replace")
+
+    return str(value)
+
+def encode ( content: Any ):
+
+    return orjson.dumps(content, default=default, option=OPTIONS)
+
+class FastJSONResponse(Response):
+
+    media_type = "application/json"
+
+    def render ( self, content: Any ):
+
+        if isinstance(content, (bytes, bytearray, memoryview)): return bytes(content)
+        return encode(content)
 
 def ok ( data=None, message="Success" ):
-    return JSONResponse(content={
+    return FastJSONResponse(content={
         "success": True,
         "message": message,
         "data": data or {}
     })
 
 def error ( message="Error", code=400 ):
-    return JSONResponse(status_code=code, content={
+    return FastJSONResponse(status_code=code, content={
         "success": False,
         "message": message
     })
+
+def chunks ( items: Iterable, size: int = 512 ):
+
+    yield b"["
+    batch, first = [], True
+
+    for item in items:
+
+        batch.append(encode(item))
+
+        if len(batch) >= size:
+            yield (b"" if first else b",") + b",".join(batch)
+            batch, first = [], False
+
+    if batch: yield (b"" if first else b",") + b",".join(batch)
+    yield b"]"
+
+async def achunks ( items: Any, size: int = 512 ):
+
+    yield b"["
+    batch, first = [], True
+
+    async for item in items:
+
+        batch.append(encode(item))
+
+        if len(batch) >= size:
+            yield (b"" if first else b",") + b",".join(batch)
+            batch, first = [], False
+
+    if batch: yield (b"" if first else b",") + b",".join(batch)
+    yield b"]"
+
+def stream ( items: Any, size: int = 512, code: int = 200 ):
+
+    body = achunks(items, size) if hasattr(items, "__aiter__") else chunks(items, size)
+    return StreamingResponse(body, status_code=code, media_type="application/json")
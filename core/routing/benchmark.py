@@ -0,0 +1,94 @@
+from starlette.routing import compile_path
+from .tree import RouteTree
+import time, json, sys
+
+def generate ( count: int ):
+
+    routes, probes = [], []
+
+    for i in range(count):
+
+        kind = i % 3
+
+        if kind == 0: path = f"/v1/resource{i}"
+        elif kind == 1: path = f"/v1/resource{i}/{{id}}"
+        else: path = f"/v1/resource{i}/{{id}}/items/{{item_id}}"
+
+        routes.append(("GET", path))
+        probes.append(("GET", path.replace("{id}", "42").replace("{item_id}", "7")))
+
+    routes.append(("GET", "/{path_name:path}"))
+    probes.append(("GET", "/missing/page"))
+
+    return routes, probes
+
+def regex_router ( routes: list ):
+
+    compiled = [(method, compile_path(path)[0]) for method, path in routes]
+
+    def match ( method: str, path: str ):
+
+        for m, regex in compiled:
+            found = regex.match(path)
+            if found and m == method: return found.groupdict()
+
+        return None
+
+    return match
+
+def tree_router ( routes: list ):
+
+    tree = RouteTree()
+    for method, path in routes: tree.insert(path, [method], path)
+
+    return tree.match
+
+def measure ( match, probes: list, rounds: int ):
+
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        for method, path in probes: match(method, path)
+
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(probes)) * 1e6
+
+def run ( counts: tuple = (10, 100, 1000), lookups: int = 20000 ):
+
+    results = []
+
+    for count in counts:
+
+        routes, probes = generate(count)
+        tail   = probes[-4:]
+        rounds = max(1, lookups // len(probes))
+
+        regex, tree = regex_router(routes), tree_router(routes)
+
+        results.append({
+            "routes"        : count,
+            "regex_avg_us"  : round(measure(regex, probes, rounds), 3),
+            "tree_avg_us"   : round(measure(tree, probes, rounds), 3),
+            "regex_tail_us" : round(measure(regex, tail, lookups // len(tail)), 3),
+            "tree_tail_us"  : round(measure(tree, tail, lookups // len(tail)), 3),
+        })
+
+    return results
+
+def report ( results: list ):
+
+    print(f"{'ROUTES':<10} {'REGEX AVG (us)':<16} {'TREE AVG (us)':<16} {'REGEX TAIL (us)':<16} {'TREE TAIL (us)':<16} {'SPEEDUP'}")
+    print('-'*90)
+
+    for r in results:
+        speedup = r['regex_tail_us'] / r['tree_tail_us'] if r['tree_tail_us'] else 0
+        print(f"{r['routes']:<10} {r['regex_avg_us']:<16} {r['tree_avg_us']:<16} {r['regex_tail_us']:<16} {r['tree_tail_us']:<16} {speedup:.1f}x")
+
+    print('-'*90)
+
+if __name__ == "__main__":
+
+    results = run()
+
+    if "--json" in sys.argv: print(json.dumps(results, indent=4))
+    else: report(results)
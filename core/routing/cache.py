@@ -0,0 +1,182 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from contextvars import ContextVar
+from collections import OrderedDict
+from typing import Any
+from core.interface.response import FastJSONResponse
+import functools, inspect, asyncio, time
+
+current_request = ContextVar("current_request", default=None)
+
+class Frozen:
+
+    __slots__ = ("body", "status", "headers")
+
+    def __init__ ( self, response: Response ):
+
+        self.body    = bytes(response.body)
+        self.status  = response.status_code
+        self.headers = tuple(response.raw_headers)
+
+    def thaw ( self ):
+
+        response             = Response(self.body, self.status)
+        response.raw_headers = list(self.headers)
+
+        return response
+
+class ResponseCache:
+
+    def __init__ ( self, max_entries: int = 10_000, max_bytes: int = 64 * 1024 * 1024 ):
+
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.entries     = OrderedDict()
+        self.inflight    = {}
+        self.bytes       = 0
+        self.hits        = 0
+        self.misses      = 0
+
+    def freeze ( self, value: Any ):
+
+        # Plain return values are rendered once so hits never share a mutable object.
+        try: return Frozen(value if isinstance(value, Response) else FastJSONResponse(value))
+        except Exception: return None
+
+    def size_of ( self, frozen: Frozen ):
+
+        return len(frozen.body) + sum(len(k) + len(v) for k, v in frozen.headers)
+
+    def cacheable ( self, value: Any ):
+
+        status = getattr(value, "status_code", 200)
+        return status == 200 and (not hasattr(value, "body_iterator"))
+
+    def get ( self, key: Any ):
+
+        entry = self.entries.get(key)
+        if entry is None: return None
+
+        expires, size, value = entry
+
+        if expires <= time.monotonic():
+            self.delete(key)
+            return None
+
+        self.entries.move_to_end(key)
+        return entry
+
+    def set ( self, key: Any, value: Any, ttl: float ):
+
+        frozen = self.freeze(value)
+        if frozen is None: return None
+
+        size = self.size_of(frozen)
+        if size > self.max_bytes: return frozen
+
+        self.delete(key)
+        self.entries[key] = (time.monotonic() + ttl, size, frozen)
+        self.bytes += size
+
+        while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            self.delete(next(iter(self.entries)))
+
+        return frozen
+
+    def delete ( self, key: Any ):
+
+        entry = self.entries.pop(key, None)
+        if entry: self.bytes -= entry[1]
+
+        return entry is not None
+
+    def clear ( self ):
+
+        self.entries.clear()
+        self.bytes = 0
+
+        return True
+
+    def key ( self, request: Any, route_key: str, vary: tuple ):
+
+        domain  = getattr(request.state, "domain", None) or {}
+        query   = tuple(sorted(request.query_params.multi_items()))
+        headers = tuple(request.headers.get(h, "") for h in vary)
+
+        return (route_key, request.url.path, query, headers, tuple(sorted(domain.items())))
+
+    async def fetch ( self, key: Any, ttl: float, call: Any ):
+
+        while True:
+
+            entry = self.get(key)
+
+            if entry is not None:
+                self.hits += 1
+                return entry[2].thaw()
+
+            waiter = self.inflight.get(key)
+            if waiter is None: break
+
+            try: frozen = await asyncio.shield(waiter)
+            except asyncio.CancelledError:
+                if waiter.cancelled(): continue
+                raise
+
+            return await call() if frozen is None else frozen.thaw()
+
+        self.misses += 1
+        waiter = self.inflight[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            value = await call()
+            waiter.set_result(self.set(key, value, ttl) if self.cacheable(value) else None)
+
+            return value
+
+        except Exception as e:
+            waiter.set_exception(e)
+            waiter.exception()
+            raise
+
+        except BaseException:
+            waiter.cancel()
+            raise
+
+        finally:
+            self.inflight.pop(key, None)
+
+    def stats ( self ):
+
+        return {
+            "entries" : len(self.entries),
+            "bytes"   : self.bytes,
+            "hits"    : self.hits,
+            "misses"  : self.misses,
+        }
+
+response_cache = ResponseCache()
+
+def resolve_cache ( ctx: dict, handler: Any ):
+
+    options = ctx.get('cache')
+
+    if not options or not callable(handler): return handler
+    if 'GET' not in list(ctx.get('methods') or []): return handler
+
+    ttl, vary = float(options[0]), tuple(str(h).lower() for h in options[1])
+    route_key = str(ctx.get('key'))
+    is_async  = inspect.iscoroutinefunction(handler)
+
+    @functools.wraps(handler)
+    async def wrapper ( *args, **kwargs ):
+
+        async def call ():
+            return await handler(*args, **kwargs) if is_async else await run_in_threadpool(handler, *args, **kwargs)
+
+        request = current_request.get()
+        if request is None or request.method != 'GET': return await call()
+
+        return await response_cache.fetch(response_cache.key(request, route_key, vary), ttl, call)
+
+    return wrapper
@@ -0,0 +1,73 @@
+from contextlib import asynccontextmanager
+from typing import Any
+import threading, inspect
+
+class ControllerRegistry:
+
+    def __init__ ( self ):
+
+        self.instances = {}
+        self.started   = []
+        self.lock      = threading.Lock()
+
+    def instance ( self, klass: type ):
+
+        found = self.instances.get(klass)
+        if found is not None: return found
+
+        with self.lock:
+
+            found = self.instances.get(klass)
+            if found is None: found = self.instances[klass] = klass()
+
+        return found
+
+    async def _call ( self, instance: Any, hook: str ):
+
+        fn = getattr(instance, hook, None)
+        if not callable(fn): return False
+
+        result = fn()
+        if inspect.isawaitable(result): await result
+
+        return True
+
+    async def startup ( self ):
+
+        for instance in list(self.instances.values()):
+
+            if instance in self.started: continue
+            if await self._call(instance, "startup"): self.started.append(instance)
+
+        return True
+
+    async def shutdown ( self ):
+
+        while self.started:
+            await self._call(self.started.pop(), "shutdown")
+
+        return True
+
+    def bind ( self, app: Any ):
+
+        inner = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan ( target ):
+
+            async with inner(target) as state:
+
+                await self.startup()
+
+                try: yield state
+                finally: await self.shutdown()
+
+        app.router.lifespan_context = lifespan
+        return app
+
+    def clear ( self ):
+
+        with self.lock: self.instances.clear()
+        return True
+
+controllers = ControllerRegistry()
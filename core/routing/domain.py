@@ -0,0 +1,52 @@
+from functools import lru_cache
+import re
+
+class DomainMatcher:
+
+    def __init__ ( self, patterns: list, cache_size: int = 4096 ):
+
+        self.patterns = [self._compile(p) for p in patterns or []]
+        self.match    = lru_cache(maxsize=cache_size)(self._match)
+
+    def _compile ( self, pattern: str ):
+
+        pattern = (pattern or "").strip().lower()
+
+        if pattern in ("", "*", "default"): return ("any", None)
+        if "*" not in pattern and "{" not in pattern: return ("exact", pattern)
+
+        if "{" not in pattern: return ("wildcard", re.compile(re.escape(pattern).replace("\\*", ".*")))
+
+        parts = []
+
+        for part in pattern.split("."):
+
+            if part.startswith("{") and part.endswith("}"): parts.append(f"(?P<{part.strip('{}')}>[^.]+)")
+            else: parts.append(re.escape(part).replace("\\*", "[^.]*"))
+
+        return ("capture", re.compile(r"\.".join(parts)))
+
+    def _match ( self, host: str ):
+
+        if not host: return False
+
+        for kind, value in self.patterns:
+
+            if kind == "any": return True
+            if kind == "exact" and host == value: return True
+            if kind == "wildcard" and value.fullmatch(host): return True
+
+            if kind == "capture":
+                found = value.fullmatch(host)
+                if found: return tuple(found.groupdict().items()) or True
+
+        return False
+
+    def __call__ ( self, host: str ):
+
+        result = self.match(str(host or "").strip().lower())
+        return dict(result) if isinstance(result, tuple) else result
+
+    def info ( self ):
+
+        return self.match.cache_info()._asdict()
@@ -1,12 +1,14 @@
 from fastapi import Depends, Request, HTTPException
 from typing import Any
 from functools import partial
-import threading, inspect, time, re
-from cachetools import TTLCache
+import inspect, asyncio
 from core.support.utils import *
-
-rate_lock   = threading.Lock()
-rate_bucket = TTLCache(maxsize=50000, ttl=3600)
+from .limiter import get_limiter
+from .domain import DomainMatcher
+from .manifest import manifest
+from .controllers import controllers
+from .profiler import profiler
+from .cache import current_request
 
 def build_domain_patterns ( domains: list, subdomains: list ) :
     
@@ -14,31 +16,10 @@ def build_domain_patterns ( domains: list, subdomains: list ) :
     elif domains: return [str(d).strip().lower() for d in domains]
     elif subdomains: return [str(s).strip().lower() for s in subdomains]
 
-def match_domain_pattern ( pattern: str, host: str ):
- 
-    if not host: return False
-
-    pattern = (pattern or "").strip().lower()
-    host = host.strip().lower()
-
-    if pattern in ("", "*", "default"): return True
-
-    if "*" in pattern and not "{" in pattern:
-        regex = "^" + re.escape(pattern).replace("\\*", ".*") + "$"
-        return bool(re.match(regex, host))
-
-    params  = {}
-    parts_p = pattern.split(".")
-    parts_h = host.split(".")
+def resolve_domains ( domains: list, subdomains: list ):
 
-    if len(parts_p) != len(parts_h): return False
-
-    for pp, ph in zip(parts_p, parts_h):
-        
-        if pp.startswith("{") and pp.endswith("}"): params[pp.strip("{}")] = ph
-        elif pp != ph: return False
-
-    return params or True
+    if not domains and not subdomains: return None
+    return DomainMatcher(build_domain_patterns(domains, subdomains))
 
 def controller_variants ( name: str ):
     
@@ -79,14 +60,32 @@ def resolve_controller_name ( namespace: str, controller: str ):
     
     namespace = namespace.strip('.') or module.find('controllers', True)
     namespace = (namespace.rstrip('.') + basepath) if not is_root else basepath.lstrip('.')
+    cached    = manifest.get('controller', f"{namespace}|{ctr_name}")
+
+    if cached: return cached
 
     for name in controller_variants(ctr_name):
-        if module.exists(f"{namespace}.{name}"): return name
+        if module.exists(f"{namespace}.{name}"): return manifest.set('controller', f"{namespace}|{ctr_name}", name)
+
+def resolve_action ( instance: Any, method: str ):
+
+    for name in (method, "invoke", "__call__"):
+        if name and hasattr(instance, name): return name
+
+    raise AttributeError(f"Method '{method}' not found in controller '{instance.__class__.__name__}' ")
 
 def resolve_handler ( handler: Any, namespace: str, controller: str ):
 
     if callable(handler): return handler
     ctrl_name, method = None, None
+
+    key    = f"{namespace}|{controller}|{handler}"
+    cached = manifest.get('handler', key)
+
+    if cached:
+        mod   = module.require(cached[0], True)
+        klass = getattr(mod, cached[1], None) if mod else None
+        if klass: return getattr(controllers.instance(klass), cached[2])
     
     if isinstance(handler, (list, tuple)) and len(handler) == 2: ctrl_name, method = handler
     elif isinstance(handler, str) and "@" in handler: ctrl_name, method = handler.split("@", 1)
@@ -107,15 +106,12 @@ def resolve_handler ( handler: Any, namespace: str, controller: str ):
     if not mod: mod = module.require(f"{namespace}.{resolve_controller_name(namespace, ctrl_file)}", True)
     if not mod: raise ImportError(f"Handler module not found: {namespace} -> {handler}")
 
-    klass = resolve_controller_class(mod, ctrl_file)
-    instance = klass()
-
-    if hasattr(instance, method): resolved = getattr(instance, method)
-    elif hasattr(instance, "invoke"): resolved = getattr(instance, "invoke")
-    elif hasattr(instance, "__call__"): resolved = getattr(instance, "__call__")
-    else: raise AttributeError(f"Method '{method}' not found in controller '{klass.__name__}' ")
+    klass    = resolve_controller_class(mod, ctrl_file)
+    instance = controllers.instance(klass)
+    action   = resolve_action(instance, method)
 
-    return resolved
+    manifest.set('handler', key, [mod.__name__, klass.__name__, action])
+    return getattr(instance, action)
 
 def resolve_patterns ( path: str, patterns: dict ):
 
@@ -134,63 +130,61 @@ def resolve_middleware ( middleware: str ):
 
     return handler, params
 
+def resolve_pipeline ( middlewares: list ):
 
-async def limiter_guard ( request: Request, key: str, limit: int, per: float ):
+    pipeline = []
 
-    now    = time.time()
-    window = per * 60
-    unique = f"{request.client.host}:{key}"
+    for middleware in middlewares:
 
-    with rate_lock:
+        handler, params = resolve_middleware(str(middleware))
+        if handler: pipeline.append((handler, tuple(params), inspect.iscoroutinefunction(handler)))
 
-        start, cnt = rate_bucket.get(unique, (0.0, 0))
+    return tuple(pipeline)
 
-        if now - start >= window: start, cnt = now, 0
-        if cnt + 1 > limit: raise HTTPException(status_code = 429, detail = "Too Many Requests")
+async def limiter_guard ( request: Request, key: str, limit: int, per: float ):
 
-        rate_bucket[unique] = (start, cnt + 1)
-        return True
+    unique  = f"{request.client.host}:{key}"
+    limiter = get_limiter()
+    allowed = limiter.hit(unique, limit, per * 60, block = False)
 
-async def domain_guard ( request: Request, domains: list, subdomains: list ):
+    if allowed is None: allowed = await asyncio.to_thread(limiter.hit, unique, limit, per * 60)
+    if not allowed: raise HTTPException(status_code = 429, detail = "Too Many Requests")
 
-    host = str(request.headers.get('host', '')).split(':')[0].lower()
-    patterns = build_domain_patterns(domains, subdomains)
+    return True
 
-    for pattern in patterns:
+async def domain_guard ( request: Request, matcher: DomainMatcher ):
 
-        result = match_domain_pattern(pattern, host)
+    host   = str(request.headers.get('host', '')).split(':')[0]
+    result = matcher(host)
 
-        if isinstance(result, dict): request.path_params['domain'] = request.state.domain = result
-        if result: return True
+    if isinstance(result, dict): request.path_params['domain'] = request.state.domain = result
+    if result: return True
 
     raise HTTPException(status_code=404, detail=f"Host '{host}' not allowed")
 
 async def core_guards ( request: Request, params: dict ):
 
-    domains = list(params.get('domains'))
-    subs    = list(params.get('subdomains'))
-    limit   = list(params.get('limit'))
+    matcher = params.get('domain_matcher')
+    limit   = list(params.get('limit') or [])
     unique  = str(params.get('key'))
 
     if limit: await limiter_guard(request, unique, int(limit[0]), float(limit[1]))
-    if domains or subs: await domain_guard(request, domains, subs)
+    if matcher: await domain_guard(request, matcher)
 
     return True
 
 async def middleware_guards ( request: Request, params: dict ):
     
-    for middleware in list(params.get('middlewares')):
-
-        handler, prms = resolve_middleware(str(middleware))
-        if not handler: continue
+    for handler, prms, is_async in params.get('pipeline') or ():
 
-        result = await handler(request, *prms) if inspect.iscoroutinefunction(handler) else handler(request, *prms)
+        result = await handler(request, *prms) if is_async else handler(request, *prms)
         if result is False: raise HTTPException(status_code=403, detail=f"Middleware {handler.__name__} rejected request")
 
     return True
 
 async def all_guards ( request: Request, params: dict ):
 
+    if params.get('cache'): current_request.set(request)
     await core_guards(request, params)
     await middleware_guards(request, params)
 
@@ -198,4 +192,4 @@ async def all_guards ( request: Request, params: dict ):
 
 def resolve_guards ( params: dict ):
 
-    return [Depends(partial(all_guards, params=params))]
+    return [Depends(profiler.guard(params, partial(all_guards, params=params)))]
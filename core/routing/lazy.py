@@ -0,0 +1,86 @@
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+from typing import Any, Callable
+import asyncio
+
+class LazyEndpoint:
+
+    def __init__ ( self, factory: Callable, on_resolve: Callable = None ):
+
+        self.factory    = factory
+        self.on_resolve = on_resolve
+        self.route      = None
+        self.lock       = None
+
+    async def resolve ( self ):
+
+        if self.route is not None: return self.route
+        if self.lock is None: self.lock = asyncio.Lock()
+
+        async with self.lock:
+
+            if self.route is None:
+
+                route = await run_in_threadpool(self.factory)
+                if self.on_resolve: await self.on_resolve()
+
+                self.route = route
+
+        return self.route
+
+    async def __call__ ( self, scope: dict, receive: Any, send: Any ):
+
+        route = self.route or await self.resolve()
+        await route.handle(scope, receive, send)
+
+class LazyRegistry:
+
+    def __init__ ( self ):
+
+        self.endpoints = []
+        self.delay     = None
+        self.task      = None
+
+    def add ( self, endpoint: LazyEndpoint ):
+
+        self.endpoints.append(endpoint)
+        return endpoint
+
+    def pending ( self ):
+
+        return [e for e in self.endpoints if e.route is None]
+
+    async def warm ( self, delay: float = 0 ):
+
+        if delay: await asyncio.sleep(delay)
+
+        for endpoint in self.pending():
+
+            try: await endpoint.resolve()
+            except Exception: pass
+
+            await asyncio.sleep(0)
+
+        return True
+
+    def bind ( self, app: Any ):
+
+        if self.delay is None or not self.endpoints: return app
+
+        inner = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan ( target ):
+
+            async with inner(target) as state:
+
+                self.task = asyncio.get_running_loop().create_task(self.warm(self.delay))
+
+                try: yield state
+                finally:
+                    if not self.task.done(): self.task.cancel()
+
+        app.router.lifespan_context = lifespan
+        return app
+
+lazy_routes = LazyRegistry()
@@ -0,0 +1,215 @@
+from multiprocessing import shared_memory, resource_tracker
+from collections import OrderedDict
+from itertools import islice
+from typing import Any
+import threading, hashlib, tempfile, struct, time, os
+
+try: import fcntl
+except ImportError: fcntl = None
+
+def check ( limit: int, window: float ):
+
+    if not limit or limit < 1: raise ValueError(f"Rate limit must allow at least one request, got {limit}")
+    if not window or window <= 0: raise ValueError(f"Rate limit window must be positive, got {window}")
+
+class MemoryLimiter:
+
+    def __init__ ( self, shards: int = 64, max_keys: int = 100_000, sweep: int = 4 ):
+
+        self.shards   = [(threading.Lock(), OrderedDict()) for _ in range(max(1, shards))]
+        self.capacity = max(1, max_keys // len(self.shards))
+        self.sweep    = sweep
+
+    def _evict ( self, bucket: OrderedDict, now: float ):
+
+        stale = [key for key, (_, _, full_at) in islice(bucket.items(), self.sweep) if full_at <= now]
+        for key in stale: bucket.pop(key)
+
+    def hit ( self, key: str, limit: int, window: float, block: bool = True ):
+
+        check(limit, window)
+
+        now  = time.monotonic()
+        rate = limit / window
+
+        lock, bucket = self.shards[hash(key) % len(self.shards)]
+
+        if not lock.acquire(block): return None
+
+        try:
+
+            if key not in bucket and len(bucket) >= self.capacity:
+                self._evict(bucket, now)
+                if len(bucket) >= self.capacity: return False
+
+            tokens, last, _ = bucket.pop(key, (limit, now, now))
+            tokens  = min(limit, tokens + (now - last) * rate)
+            allowed = tokens >= 1
+
+            if allowed: tokens -= 1
+
+            bucket[key] = (tokens, now, now + (limit - tokens) / rate)
+            self._evict(bucket, now)
+
+        finally:
+            lock.release()
+
+        return allowed
+
+    def size ( self ):
+
+        return sum(len(bucket) for _, bucket in self.shards)
+
+    def clear ( self ):
+
+        for lock, bucket in self.shards:
+            with lock: bucket.clear()
+
+        return True
+
+class SharedLimiter:
+
+    slot = struct.Struct("<Qddd")
+
+    def __init__ ( self, name: str = None, slots: int = 65536, shards: int = 256, probes: int = 8 ):
+
+        if fcntl is None: raise RuntimeError("SharedLimiter requires a POSIX host (fcntl)")
+
+        self.probes = max(1, probes)
+        self.groups = max(1, slots // self.probes)
+        self.shards = max(1, shards)
+        self.locks  = [threading.Lock() for _ in range(self.shards)]
+        self.name   = name or self._name()
+        self.owner  = False
+        self.memory = self._attach(self.name, self.groups * self.probes * self.slot.size)
+        self.lock   = open(os.path.join(tempfile.gettempdir(), f"{self.name}.lock"), "a+b")
+
+    def _name ( self ):
+
+        scope = f"{os.getcwd()}:{os.getenv('APP_ENV') or os.getenv('ENV') or 'local'}:{self.groups}:{self.probes}:{self.slot.size}"
+        return "turbox_limiter_" + hashlib.blake2b(scope.encode(), digest_size=6).hexdigest()
+
+    def _attach ( self, name: str, size: int ):
+
+        try:
+            memory     = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.owner = True
+            return memory
+
+        except FileExistsError: pass
+
+        memory = shared_memory.SharedMemory(name=name)
+
+        try: resource_tracker.unregister(memory._name, "shared_memory")
+        except Exception: pass
+
+        if memory.size < size:
+            memory.close()
+            raise ValueError(f"Shared limiter segment {name} holds {memory.size} bytes, expected {size}; pass a different name or unlink the stale segment")
+
+        return memory
+
+    def _digest ( self, key: str ):
+
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+    def _lock ( self, shard: int, block: bool ):
+
+        # lockf only excludes other processes; the thread lock covers this one.
+        if not self.locks[shard].acquire(block): return False
+
+        try: fcntl.lockf(self.lock, fcntl.LOCK_EX if block else fcntl.LOCK_EX | fcntl.LOCK_NB, 1, shard)
+        except OSError:
+            self.locks[shard].release()
+            if block: raise
+            return False
+
+        return True
+
+    def _unlock ( self, shard: int ):
+
+        try: fcntl.lockf(self.lock, fcntl.LOCK_UN, 1, shard)
+        finally: self.locks[shard].release()
+
+    def hit ( self, key: str, limit: int, window: float, block: bool = True ):
+
+        check(limit, window)
+
+        now    = time.time()
+        rate   = limit / window
+        digest = self._digest(key)
+        group  = digest % self.groups
+        shard  = group % self.shards
+        buffer = self.memory.buf
+        size   = self.slot.size
+
+        if not self._lock(shard, block): return None
+
+        try:
+
+            target, free, tokens, last = None, None, limit, now
+
+            for index in range(group * self.probes, (group + 1) * self.probes):
+
+                h, t, l, full_at = self.slot.unpack_from(buffer, index * size)
+
+                if h == digest:
+                    target, tokens, last = index, t, l
+                    break
+
+                # Only empty or fully refilled slots may be reused; taking an
+                # active client's slot would hand it a fresh window.
+                if h == 0: full_at = -1.0
+                if full_at <= now and (free is None or full_at < free[1]): free = (index, full_at)
+
+            if target is None:
+                if free is None: return False
+                target = free[0]
+
+            tokens  = min(limit, tokens + max(0.0, now - last) * rate)
+            allowed = tokens >= 1
+
+            if allowed: tokens -= 1
+            self.slot.pack_into(buffer, target * size, digest, tokens, now, now + (limit - tokens) / rate)
+
+        finally:
+            self._unlock(shard)
+
+        return allowed
+
+    def size ( self ):
+
+        buffer = self.memory.buf
+        return sum(1 for i in range(self.groups * self.probes) if self.slot.unpack_from(buffer, i * self.slot.size)[0])
+
+    def clear ( self ):
+
+        self.memory.buf[:] = bytes(len(self.memory.buf))
+        return True
+
+    def close ( self, unlink: bool = False ):
+
+        self.lock.close()
+        self.memory.close()
+
+        if unlink:
+            try: self.memory.unlink()
+            except FileNotFoundError: pass
+
+        return True
+
+backends = {
+    "memory" : MemoryLimiter,
+    "shared" : SharedLimiter,
+}
+
+current = {"limiter": None}
+
+def use_limiter ( backend: Any = "memory", **options ):
+
+    current["limiter"] = backends[str(backend)](**options) if isinstance(backend, str) else backend
+    return current["limiter"]
+
+def get_limiter ():
+
+    return current["limiter"] or use_limiter()
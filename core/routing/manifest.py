@@ -0,0 +1,86 @@
+from typing import Any
+from core.support.utils import *
+import os, json, hashlib
+
+class RouteManifest:
+
+    def __init__ ( self ):
+
+        self.enabled   = False
+        self.path      = None
+        self.sources   = []
+        self.signature = None
+        self.entries   = {}
+        self.dirty     = False
+
+    def enable ( self, path: str = None, sources: list = None ):
+
+        self.enabled = True
+        self.path    = path or os.path.join(module.find('cache'), 'routes.json')
+        self.sources = sources or [module.find('routes'), module.find('controllers')]
+
+        return self
+
+    def fingerprint ( self ):
+
+        digest = hashlib.sha1()
+
+        for source in self.sources:
+
+            for root, dirs, files in os.walk(os.path.abspath(source)):
+
+                dirs.sort()
+
+                for name in sorted(files):
+
+                    if not name.endswith('.py'): continue
+
+                    stat = os.stat(os.path.join(root, name))
+                    digest.update(f"{os.path.join(root, name)}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+
+        return digest.hexdigest()
+
+    def load ( self ):
+
+        if not self.enabled: return False
+
+        self.signature = self.fingerprint()
+        self.entries, self.dirty = {}, False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f: data = json.load(f)
+        except (OSError, ValueError): return False
+
+        if data.get('signature') != self.signature: return False
+
+        self.entries = dict(data.get('entries') or {})
+        return True
+
+    def save ( self ):
+
+        if not self.enabled or not self.dirty: return False
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp = f"{self.path}.{os.getpid()}.tmp"
+
+        with open(temp, 'w', encoding='utf-8') as f: json.dump({'signature': self.signature, 'entries': self.entries}, f)
+        os.replace(temp, self.path)
+
+        self.dirty = False
+        return True
+
+    def get ( self, kind: str, key: str ):
+
+        if not self.enabled: return None
+        return self.entries.get(f"{kind}:{key}")
+
+    def set ( self, kind: str, key: str, value: Any ):
+
+        if not self.enabled: return value
+
+        self.entries[f"{kind}:{key}"] = value
+        self.dirty = True
+
+        return value
+
+manifest = RouteManifest()
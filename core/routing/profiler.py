@@ -0,0 +1,204 @@
+from contextvars import ContextVar
+from collections import deque
+from typing import Any
+import functools, inspect, time
+
+guard_time = ContextVar("guard_time", default=0.0)
+
+class RouteStats:
+
+    __slots__ = ("methods", "path", "name", "count", "errors", "guards", "handler", "samples")
+
+    def __init__ ( self, methods: list = None, path: str = '', name: str = '', samples: int = 2048 ):
+
+        self.methods = list(methods or [])
+        self.path    = path
+        self.name    = name
+        self.count   = 0
+        self.errors  = 0
+        self.guards  = 0.0
+        self.handler = 0.0
+        self.samples = deque(maxlen=samples)
+
+    def percentile ( self, data: list, q: float ):
+
+        if not data: return 0.0
+        return data[min(len(data) - 1, int(round(q * (len(data) - 1))))]
+
+    def to_dict ( self ):
+
+        data  = sorted(self.samples)
+        total = self.guards + self.handler
+
+        return {
+            "methods"    : self.methods,
+            "path"       : self.path,
+            "name"       : self.name,
+            "count"      : self.count,
+            "errors"     : self.errors,
+            "p50_ms"     : round(self.percentile(data, 0.50) * 1000, 3),
+            "p95_ms"     : round(self.percentile(data, 0.95) * 1000, 3),
+            "p99_ms"     : round(self.percentile(data, 0.99) * 1000, 3),
+            "guards_ms"  : round(self.guards * 1000, 3),
+            "handler_ms" : round(self.handler * 1000, 3),
+            "guards_pct" : round(self.guards / total * 100, 1) if total else 0.0,
+        }
+
+class RouteProfiler:
+
+    def __init__ ( self ):
+
+        self.enabled     = False
+        self.routes      = {}
+        self.middlewares = {}
+
+    def enable ( self, enabled: bool = True ):
+
+        self.enabled = enabled
+        return self
+
+    def reset ( self ):
+
+        for stats in [*self.routes.values(), *self.middlewares.values()]:
+            stats.count, stats.errors, stats.guards, stats.handler = 0, 0, 0.0, 0.0
+            stats.samples.clear()
+
+        return True
+
+    def register ( self, ctx: dict ):
+
+        key = str(ctx.get('key'))
+
+        if key not in self.routes:
+            self.routes[key] = RouteStats(ctx.get('methods'), str(ctx.get('path')), str(ctx.get('name') or ''))
+
+        return self.routes[key]
+
+    def _finish ( self, stats: RouteStats, elapsed: float, failed: bool ):
+
+        guards = guard_time.get()
+
+        stats.count   += 1
+        stats.handler += elapsed
+        stats.samples.append(guards + elapsed)
+
+        if failed: stats.errors += 1
+
+    def endpoint ( self, ctx: dict, handler: Any ):
+
+        if not self.enabled or not callable(handler): return handler
+        stats = self.register(ctx)
+
+        if inspect.iscoroutinefunction(handler):
+
+            @functools.wraps(handler)
+            async def wrapper ( *args, **kwargs ):
+
+                start, failed = time.perf_counter(), True
+
+                try:
+                    result = await handler(*args, **kwargs)
+                    failed = False
+                    return result
+
+                finally: self._finish(stats, time.perf_counter() - start, failed)
+
+            return wrapper
+
+        @functools.wraps(handler)
+        def wrapper ( *args, **kwargs ):
+
+            start, failed = time.perf_counter(), True
+
+            try:
+                result = handler(*args, **kwargs)
+                failed = False
+                return result
+
+            finally: self._finish(stats, time.perf_counter() - start, failed)
+
+        return wrapper
+
+    def guard ( self, ctx: dict, guard: Any ):
+
+        if not self.enabled: return guard
+        stats = self.register(ctx)
+
+        @functools.wraps(guard)
+        async def wrapper ( *args, **kwargs ):
+
+            start = time.perf_counter()
+
+            try: return await guard(*args, **kwargs)
+
+            except Exception:
+                stats.count  += 1
+                stats.errors += 1
+                stats.samples.append(time.perf_counter() - start)
+                raise
+
+            finally:
+                elapsed = time.perf_counter() - start
+                stats.guards += elapsed
+                guard_time.set(elapsed)
+
+        return wrapper
+
+    def pipeline ( self, pipeline: tuple ):
+
+        if not self.enabled: return pipeline
+        return tuple((self.middleware(handler, is_async), params, is_async) for handler, params, is_async in pipeline)
+
+    def middleware ( self, handler: Any, is_async: bool ):
+
+        name  = f"{getattr(handler, '__module__', '')}.{getattr(handler, '__name__', str(handler))}"
+        stats = self.middlewares.setdefault(name, RouteStats(path=name, name=name))
+
+        def record ( start: float, failed: bool ):
+
+            elapsed = time.perf_counter() - start
+
+            stats.count   += 1
+            stats.handler += elapsed
+            stats.samples.append(elapsed)
+
+            if failed: stats.errors += 1
+
+        if is_async:
+
+            @functools.wraps(handler)
+            async def wrapper ( *args, **kwargs ):
+
+                start, failed = time.perf_counter(), True
+
+                try:
+                    result = await handler(*args, **kwargs)
+                    failed = result is False
+                    return result
+
+                finally: record(start, failed)
+
+            return wrapper
+
+        @functools.wraps(handler)
+        def wrapper ( *args, **kwargs ):
+
+            start, failed = time.perf_counter(), True
+
+            try:
+                result = handler(*args, **kwargs)
+                failed = result is False
+                return result
+
+            finally: record(start, failed)
+
+        return wrapper
+
+    def stats ( self ):
+
+        return {
+            "routes"      : { key: s.to_dict() for key, s in self.routes.items() },
+            "middlewares" : { key: s.to_dict() for key, s in self.middlewares.items() },
+        }
+
+profiler = RouteProfiler()
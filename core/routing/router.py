@@ -1,8 +1,17 @@
 from fastapi import FastAPI, APIRouter
+from fastapi.routing import APIRoute
+from functools import partial
 from fastapi.responses import RedirectResponse
 from typing import Union, Any
-import pkgutil, os, json, copy
+import os, json, copy
 from .helpers import *
+from .tree import compile_router
+from .limiter import use_limiter, check as check_limit
+from .manifest import manifest
+from .controllers import controllers
+from .profiler import profiler
+from .cache import resolve_cache
+from .lazy import LazyEndpoint, lazy_routes
 
 class RouteCall:
 
@@ -21,7 +30,7 @@ class RouteCall:
             .controller(self._get('controller')) \
             .middleware(*list(self._get('middlewares'))) \
             .handler(self._get('handler')) \
-            .path(self._get('path'))
+            .path(self._get('route_path'))
 
     def _set ( self, key: str, value: Any, merge=False ):
         
@@ -50,6 +59,7 @@ class RouteCall:
 
     def handler ( self, value: Any  ):
 
+        if self._get('lazy') and not callable(value): return self._set("handler", value)
         return self._set("handler", resolve_handler(value, self._get('namespace'), self._get('controller')))
 
     def method ( self, *args  ):
@@ -91,7 +101,12 @@ class RouteCall:
 
     def limit ( self, limit: int, per: float = 1 ):
         
+        check_limit(limit, per)
         return self._set("limit", (limit, per))
+
+    def cache ( self, ttl: float, vary: list = None ):
+
+        return self._set("cache", (ttl, list(vary or [])))
     
     def where ( self, **patterns ):
 
@@ -101,33 +116,61 @@ class RouteCall:
         
         self._set('key', string.join(self._get('path'), *self._get('subdomains'), *self._get('domains'), *self._get('methods')))
         self._set('path', resolve_patterns(str(self._get('path', '')), dict(self._get('patterns', {}))))
+        self._set('pipeline', profiler.pipeline(resolve_pipeline(list(self._get('middlewares', [])))))
+        self._set('domain_matcher', resolve_domains(list(self._get('domains', [])), list(self._get('subdomains', []))))
         self._set('depends', resolve_guards({**self.ctx}))
 
         return {**self.ctx}
 
-    async def init ( self, router: APIRouter ):
+    def options ( self, context: dict, handler: Any ):
+
+        return {
+            "path"         : str(context.get('path')),
+            "endpoint"     : profiler.endpoint(context, resolve_cache(context, handler)),
+            "methods"      : list(context.get('methods')),
+            "name"         : str(context.get('name')),
+            "tags"         : list(context.get('tags')),
+            "dependencies" : list(context.get('depends')),
+        }
+
+    def resolve ( self, context: dict ):
+
+        handler = resolve_handler(context.get('handler'), str(context.get('namespace')), str(context.get('controller')))
+
+        obj = APIRoute(**self.options(context, handler))
+        obj.extra = {**context, 'handler': handler}
+
+        return obj
+
+    def register ( self, router: APIRouter ):
 
         context = self.build()
 
-        router.add_api_route(
-            path=str(context.get('path')),
-            endpoint=context.get('handler'),
-            methods=list(context.get('methods')),
-            name=str(context.get('name')),
-            tags=list(context.get('tags')),
-            dependencies=list(context.get('depends'))
-        )
+        if context.get('lazy') and not callable(context.get('handler')):
+
+            endpoint = lazy_routes.add(LazyEndpoint(partial(self.resolve, context), controllers.startup))
+            router.add_route(str(context.get('path')), endpoint, methods=list(context.get('methods')), name=str(context.get('name')), include_in_schema=False)
+
+            return router
+
+        router.add_api_route(**self.options(context, context.get('handler')))
 
         obj = router.routes[-1]
         obj.extra = {**getattr(obj, "extra", {}), **context}
 
         return router
 
+    async def init ( self, router: APIRouter ):
+
+        return self.register(router)
+
 class Route:
 
     def __init__ ( self ):
 
         self.ctx     = dict()
+        self.tree    = None
+        self.timings = {}
         self._routes = []
         self._stack  = [self._object()]
 
@@ -162,6 +205,8 @@ class Route:
             "tags"        : [],
             "version"     : None,
             "limit"       : None,
+            "cache"       : None,
+            "lazy"        : False,
             "patterns"    : [],
             "group"       : '',
             "domains"     : [],
@@ -237,8 +282,23 @@ class Route:
 
     def limit ( self, limit: int, per: float = 1 ):
         
+        check_limit(limit, per)
         return self._set("limit", (limit, per))
 
+    def cache ( self, ttl: float, vary: list = None ):
+
+        return self._set("cache", (ttl, list(vary or [])))
+
+    def lazy ( self, enabled: bool = True, warmup: float = None ):
+
+        lazy_routes.delay = warmup
+        return self._set("lazy", enabled)
+
+    def limiter ( self, backend: Any = "memory", **options ):
+
+        use_limiter(backend, **options)
+        return self
+
     def where ( self, **patterns ):
 
         return self._set("patterns", patterns, True)
@@ -349,31 +409,102 @@ class Route:
 
         return json.dumps(result, indent=4)
     
-    def build ( self, path: str = None ):
+    def snapshot ( self, path: str = None, sources: list = None ):
+
+        manifest.enable(path, sources)
+        return self
+
+    def profile ( self, enabled: bool = True ):
+
+        profiler.enable(enabled)
+        return self
+
+    def stats ( self ):
+
+        return profiler.stats()
+
+    def report ( self ):
+
+        stats = self.stats()
+
+        print(f"{'METHODS':<10} {'PATH':<40} {'CALLS':<8} {'ERRORS':<8} {'P50 MS':<10} {'P95 MS':<10} {'P99 MS':<10} {'GUARDS %'}")
+        print('-'*120)
+
+        for group in ('routes', 'middlewares'):
+
+            for s in stats[group].values():
+
+                methods = ','.join(s.get('methods', [])) or '-'
+                print(f"{methods:<10} {s['path']:<40} {s['count']:<8} {s['errors']:<8} {s['p50_ms']:<10} {s['p95_ms']:<10} {s['p99_ms']:<10} {s['guards_pct']}")
+
+        print('-'*120)
+        print(f"{'TOTAL':<10} {len(stats['routes'])} routes, {len(stats['middlewares'])} middlewares".ljust(120))
+
+        return stats
+
+    def imports ( self ):
+
+        timings = sorted(self.timings.items(), key=lambda t: t[1], reverse=True)
+
+        print(f"{'MODULE':<60} {'SECONDS'}")
+        print('-'*120)
+
+        for name, elapsed in timings:
+            print(f"{name:<60} {elapsed:.6f}")
+
+        print('-'*120)
+        print(f"{'TOTAL':<60} {len(timings)} modules".ljust(120))
+
+        return dict(timings)
+
+    def build ( self, path: str = None, parallel: bool = False ):
   
+        manifest.load()
+
         path = module.normalize(path or module.find('routes', True))
         dirp = os.path.abspath(path.strip().replace(".", "/"))
+
+        if parallel: self.timings.update(module.preload(module.find('controllers', True), recursive=True))
         
         if os.path.isdir(dirp):
             
-            for _, module_name, _ in pkgutil.iter_modules([dirp]):
-                module.require(f"{path}.{module_name}")
+            for name in module.discover(path):
+                _, elapsed = module.timed_require(name, False)
+                self.timings[name] = round(elapsed, 6)
 
         elif os.path.isfile(dirp):
             
             mod_name = os.path.splitext(os.path.basename(dirp))[0]
             module.require(f"{path}.{mod_name}")
 
+        manifest.save()
         return self._routes
 
-    async def init ( self, app: FastAPI ):
+    def compile ( self, app: FastAPI, router: APIRouter = None ):
 
-        self.build()
+        self.tree = compile_router(app.router, router.routes if router else None)
+        return self.tree
+
+    def register ( self, app: FastAPI, compiled: bool = False, parallel: bool = False, path: str = None ):
+
+        if getattr(app.state, "routes", None) is self: return app
+
+        self.build(path, parallel=parallel)
 
         router = APIRouter()
-        for r in self._routes: await r.init(router)
+        for r in self._routes: r.register(router)
 
         app.include_router(router)
+        controllers.bind(app)
+        lazy_routes.bind(app)
+
+        if compiled: self.compile(app, router)
+
+        app.state.routes = self
         return app
 
+    async def init ( self, app: FastAPI, compiled: bool = False, parallel: bool = False, path: str = None ):
+
+        return self.register(app, compiled, parallel, path)
+
 route = Route()
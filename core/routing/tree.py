@@ -0,0 +1,208 @@
+from typing import Any
+import re
+
+CONVERTORS = {
+    "str"   : "[^/]+",
+    "path"  : ".*",
+    "int"   : "[0-9]+",
+    "float" : r"[0-9]+(?:\.[0-9]+)?",
+    "uuid"  : "[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
+}
+
+PARAM_REGEX = re.compile(r"{([a-zA-Z_][a-zA-Z0-9_]*)(?::([^{}]*(?:{[^{}]*}[^{}]*)*))?}")
+
+def compile_template ( template: str ):
+
+    regex, last = "", 0
+
+    for match in PARAM_REGEX.finditer(template):
+
+        name, kind = match.group(1), match.group(2)
+        regex += re.escape(template[last:match.start()])
+        regex += f"(?P<{name}>{CONVERTORS.get(kind or 'str', kind)})"
+        last = match.end()
+
+    return re.compile(regex + re.escape(template[last:]))
+
+def is_tail ( segment: str ):
+
+    return any(kind == "path" for _, kind in PARAM_REGEX.findall(segment))
+
+class RouteNode:
+
+    __slots__ = ("static", "params", "tails", "methods", "first")
+
+    def __init__ ( self ):
+
+        self.static  = {}
+        self.params  = []
+        self.tails   = []
+        self.methods = {}
+        self.first   = float("inf")
+
+    def child ( self, segment: str ):
+
+        if "{" not in segment: return self.static.setdefault(segment, RouteNode())
+
+        for key, _, _, node in self.params:
+            if key == segment: return node
+
+        match  = PARAM_REGEX.fullmatch(segment)
+        name   = match.group(1) if match and not match.group(2) else None
+        regex  = None if name else compile_template(segment)
+        node   = RouteNode()
+
+        self.params.append((segment, name, regex, node))
+        return node
+
+    def tail ( self, template: str ):
+
+        for key, _, methods in self.tails:
+            if key == template: return methods
+
+        methods = {}
+        self.tails.append((template, compile_template(template), methods))
+
+        return methods
+
+class RouteTree:
+
+    def __init__ ( self ):
+
+        self.root  = RouteNode()
+        self.count = 0
+
+    def split ( self, path: str ):
+
+        return str(path or "/").split("/")[1:] or [""]
+
+    def insert ( self, path: str, methods: Any, target: Any ):
+
+        node     = self.root
+        segments = self.split(path)
+        entry    = (self.count, target)
+
+        for index, segment in enumerate(segments):
+
+            node.first = min(node.first, entry[0])
+
+            if is_tail(segment):
+                leaf = node.tail("/".join(segments[index:]))
+                for method in methods: leaf.setdefault(str(method).upper(), entry)
+                break
+
+            node = node.child(segment)
+
+        else:
+            node.first = min(node.first, entry[0])
+            for method in methods: node.methods.setdefault(str(method).upper(), entry)
+
+        self.count += 1
+        return self
+
+    def build ( self, routes: list ):
+
+        for r in flatten(routes):
+
+            path, methods = getattr(r, "path", None), getattr(r, "methods", None)
+            if path and methods: self.insert(path, methods, r)
+
+        return self
+
+    def _search ( self, node: RouteNode, segments: list, index: int, method: str, params: dict, best: tuple = None ):
+
+        # Every branch that could hold an earlier declared route is visited, so
+        # the first declared match wins exactly as in the router's linear scan.
+        if best is not None and node.first >= best[0]: return best
+
+        if index == len(segments):
+            entry = node.methods.get(method)
+            return (*entry, dict(params)) if entry is not None and (best is None or entry[0] < best[0]) else best
+
+        segment = segments[index]
+        child   = node.static.get(segment)
+
+        if child is not None: best = self._search(child, segments, index + 1, method, params, best)
+
+        if segment:
+
+            for _, name, regex, child in node.params:
+
+                if name: values = {name: segment}
+                else:
+                    match = regex.fullmatch(segment)
+                    if not match: continue
+                    values = match.groupdict()
+
+                best = self._search(child, segments, index + 1, method, {**params, **values}, best)
+
+        if node.tails:
+
+            rest = "/".join(segments[index:])
+
+            for _, regex, methods in node.tails:
+
+                entry = methods.get(method)
+                if entry is None or (best is not None and entry[0] >= best[0]): continue
+
+                match = regex.fullmatch(rest)
+                if match: best = (*entry, {**params, **match.groupdict()})
+
+        return best
+
+    def match ( self, method: str, path: str ):
+
+        found = self._search(self.root, self.split(path), 0, str(method).upper(), {})
+        return found[1:] if found else None
+
+class TreeDispatcher:
+
+    def __init__ ( self, router: Any, tree: RouteTree ):
+
+        self.router = router
+        self.tree   = tree
+
+    async def __call__ ( self, scope: dict, receive: Any, send: Any ):
+
+        if scope["type"] != "http": return await self.router.app(scope, receive, send)
+
+        path  = scope.get("path", "/")
+        root  = scope.get("root_path", "")
+        found = self.tree.match(scope["method"], path[len(root):] if root and path.startswith(root) else path)
+
+        if not found: return await self.router.app(scope, receive, send)
+
+        route, params = found
+        convertors    = getattr(route, "param_convertors", {})
+
+        for key, value in params.items():
+            if key in convertors: params[key] = convertors[key].convert(value)
+
+        scope.setdefault("router", self.router)
+        scope["route"] = route
+        scope["endpoint"] = getattr(route, "endpoint", None)
+        scope["path_params"] = {**scope.get("path_params", {}), **params}
+
+        await route.handle(scope, receive, send)
+
+def flatten ( routes: list ):
+
+    for r in routes:
+
+        inner = getattr(r, "original_router", None)
+        if inner is None:
+            yield r
+            continue
+
+        prefix = getattr(getattr(r, "include_context", None), "prefix", "")
+        if prefix: raise ValueError(f"Cannot compile routes included under prefix {prefix!r}; pass the included router's routes instead")
+
+        yield from flatten(inner.routes)
+
+def compile_router ( router: Any, routes: list = None ):
+
+    tree = RouteTree().build(list(router.routes if routes is None else routes))
+    if not tree.count: raise ValueError("No routes to compile")
+
+    router.middleware_stack = TreeDispatcher(router, tree)
+    return tree
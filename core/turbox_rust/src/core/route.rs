@@ -1,5 +1,6 @@
 use pyo3::prelude::*;
 use dashmap::DashMap;
+use bytes::Bytes;
 use lazy_static::lazy_static;
 use std::path::{Path, Component};
 
@@ -9,8 +10,16 @@ pub struct RouteKey {
     pub handler: String,
 }
 
+#[derive(Clone, Debug)]
+pub struct StaticResponse {
+    pub status: u16,
+    pub body: Bytes,
+    pub headers: Vec<(String, String)>,
+}
+
 lazy_static! {
     pub static ref ROUTES: DashMap<(String, String), RouteKey> = DashMap::new();
+    pub static ref STATIC_ROUTES: DashMap<(String, String), StaticResponse> = DashMap::new();
 }
 
 #[pyclass]
@@ -27,6 +36,12 @@ impl Route {
     pub fn add(&self, method: String, path: String, handler: Bound<'_, PyAny>) -> PyResult<()> {
         register_route_logic(method, path, handler)
     }
+    #[pyo3(signature = (method, path, body, status=200, headers=None))]
+    pub fn add_static(&self, method: String, path: String, body: Vec<u8>, status: u16, headers: Option<Vec<(String, String)>>) -> PyResult<()> {
+        ROUTES.remove(&(method.clone(), path.clone()));
+        STATIC_ROUTES.insert((method, path), StaticResponse { status, body: Bytes::from(body), headers: headers.unwrap_or_default() });
+        Ok(())
+    }
 
 }
 
@@ -74,6 +89,7 @@ fn register_route_logic( method: String, path: String, handler: Bound<'_, PyAny>
         }
     }
 
+    STATIC_ROUTES.remove(&(method.clone(), path.clone()));
     ROUTES.insert((method, path), RouteKey { module: mod_name, handler: func_name });
     Ok(())
 
@@ -1,4 +1,10 @@
-use actix_web::{web, App, HttpRequest, HttpResponse, HttpServer, Responder, http::KeepAlive};
+use actix_web::{web, App, HttpRequest, HttpResponse, HttpServer, Responder, http::KeepAlive, http::StatusCode};
+use actix_web::dev::{Service, ServiceResponse};
+use actix_web::body::BoxBody;
+use futures_util::future::LocalBoxFuture;
+use std::rc::Rc;
+use std::cell::Cell;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use pyo3::prelude::*;
 use pyo3::ffi;
 use pyo3::types::{PyString, PyBool, PyBytes, PyDict, PyModule};
@@ -6,11 +12,32 @@ use std::ptr;
 use std::cell::RefCell;
 use std::ffi::CString;
 use std::collections::HashMap;
+use std::io::Write;
+use std::os::unix::io::FromRawFd;
 use pythonize::depythonize;
 use serde_json::Value;
 use bytes::Bytes;
 
-use crate::core::route::{ROUTES, RouteKey};
+use crate::core::route::{ROUTES, STATIC_ROUTES, RouteKey};
+
+static NEXT_CORE: AtomicUsize = AtomicUsize::new(0);
+
+struct InflightGuard(Rc<Cell<usize>>);
+
+impl Drop for InflightGuard {
+    fn drop(&mut self) {
+        self.0.set(self.0.get().saturating_sub(1));
+    }
+}
+
+fn pin_worker() {
+    if let Some(cores) = core_affinity::get_core_ids() {
+        if !cores.is_empty() {
+            let index = NEXT_CORE.fetch_add(1, Ordering::Relaxed) % cores.len();
+            core_affinity::set_for_current(cores[index]);
+        }
+    }
+}
 
 thread_local! {
     static WORKER_INTERPRETER_STATE: RefCell<*mut ffi::PyThreadState> = RefCell::new(ptr::null_mut());
@@ -67,8 +94,8 @@ fn ensure_sub_interpreter_initialized() {
 import sys, types
 if 'turbox' not in sys.modules:
     m = types.ModuleType('turbox')
-    m.Route = type('Route', (), {'add': lambda *args, **kwargs: None})
-    m.Server = type('Server', (), {'bind': lambda *args: None, 'workers': lambda *args: None, 'config': lambda *args: None, 'run': lambda *args: None})
+    m.Route = type('Route', (), {'add': lambda *args, **kwargs: None, 'add_static': lambda *args, **kwargs: None})
+    m.Server = type('Server', (), {'bind': lambda *args: None, 'workers': lambda *args: None, 'config': lambda *args: None, 'tuning': lambda *args, **kwargs: None, 'handoff': lambda *args, **kwargs: None, 'run': lambda *args: None})
     m.Request = type('Request', (), {'json': lambda *args, **kwargs: None})
     m.Response = type('Response', (), {'json': lambda *args, **kwargs: None})
     sys.modules['turbox'] = m
@@ -93,6 +120,12 @@ pub struct Server {
     max_connections: usize,
     backlog: u32,
     keep_alive: bool,
+    blocking_threads: usize,
+    max_inflight: usize,
+    cpu_affinity: bool,
+    listen_fd: i32,
+    ready_fd: i32,
+    shutdown_timeout: u64,
 }
 
 #[pymethods]
@@ -107,6 +140,12 @@ impl Server {
             max_connections: 100_000,
             backlog: 16 * 1024,
             keep_alive: true,
+            blocking_threads: 0,
+            max_inflight: 0,
+            cpu_affinity: false,
+            listen_fd: -1,
+            ready_fd: -1,
+            shutdown_timeout: 30,
         }
     }
     pub fn bind(&mut self, host: String, port: u16) {
@@ -122,6 +161,18 @@ impl Server {
         self.backlog = backlog;
         self.keep_alive = keep_alive;
     }
+    #[pyo3(signature = (blocking_threads=0, max_inflight=0, cpu_affinity=false))]
+    pub fn tuning(&mut self, blocking_threads: usize, max_inflight: usize, cpu_affinity: bool) {
+        self.blocking_threads = blocking_threads;
+        self.max_inflight = max_inflight;
+        self.cpu_affinity = cpu_affinity;
+    }
+    #[pyo3(signature = (listen_fd=-1, ready_fd=-1, shutdown_timeout=30))]
+    pub fn handoff(&mut self, listen_fd: i32, ready_fd: i32, shutdown_timeout: u64) {
+        self.listen_fd = listen_fd;
+        self.ready_fd = ready_fd;
+        self.shutdown_timeout = shutdown_timeout;
+    }
     pub fn run(&self, py: Python) -> PyResult<()> {
         let host = self.host.clone();
         let port = self.port;
@@ -129,6 +180,12 @@ impl Server {
         let max_conns = self.max_connections;
         let backlog = self.backlog;
         let ka = self.keep_alive;
+        let blocking = self.blocking_threads;
+        let max_inflight = self.max_inflight;
+        let affinity = self.cpu_affinity;
+        let listen_fd = self.listen_fd;
+        let ready_fd = self.ready_fd;
+        let shutdown_timeout = self.shutdown_timeout;
 
         py.detach(move || {
             let rt = tokio::runtime::Builder::new_multi_thread()
@@ -138,21 +195,61 @@ impl Server {
 
             rt.block_on(async {
                 println!("🚀 Server running on http://{}:{} with {} workers", host, port, workers);
+                println!("   blocking threads: {}, max in-flight: {}, cpu affinity: {}", blocking, max_inflight, affinity);
                 let keep_alive_setting = if ka { KeepAlive::Os } else { KeepAlive::Disabled };
 
-                HttpServer::new(|| {
+                let server = HttpServer::new(move || {
+                    if affinity {
+                        pin_worker();
+                    }
+
+                    let inflight = Rc::new(Cell::new(0usize));
+
                     App::new()
+                        .wrap_fn(move |req, srv| -> LocalBoxFuture<'static, Result<ServiceResponse<BoxBody>, actix_web::Error>> {
+                            if max_inflight > 0 && inflight.get() >= max_inflight {
+                                let res = req.into_response(HttpResponse::ServiceUnavailable().insert_header(("retry-after", "1")).finish());
+                                return Box::pin(async move { Ok(res) });
+                            }
+
+                            inflight.set(inflight.get() + 1);
+                            let guard = InflightGuard(inflight.clone());
+                            let fut = srv.call(req);
+
+                            Box::pin(async move {
+                                let res = fut.await;
+                                drop(guard);
+                                res.map(|r| r.map_into_boxed_body())
+                            })
+                        })
                         .default_service(web::to(actix_handler))
-                })
+                });
+
+                let server = if blocking > 0 { server.worker_max_blocking_threads(blocking) } else { server };
+
+                let server = server
                 .workers(workers)
                 .backlog(backlog)
                 .keep_alive(keep_alive_setting)
                 .max_connections(max_conns)
-                .bind((host, port))
-                .expect("Failed to bind to address")
-                .run()
-                .await
-                .expect("Server error");
+                .shutdown_timeout(shutdown_timeout);
+
+                let server = if listen_fd >= 0 {
+                    let listener = unsafe { std::net::TcpListener::from_raw_fd(listen_fd) };
+                    listener.set_nonblocking(true).expect("Failed to configure inherited socket");
+                    server.listen(listener)
+                } else {
+                    server.bind((host, port))
+                };
+
+                let running = server.expect("Failed to bind to address").run();
+
+                if ready_fd >= 0 {
+                    let mut ready = unsafe { std::fs::File::from_raw_fd(ready_fd) };
+                    let _ = writeln!(ready, "{}", std::process::id());
+                }
+
+                running.await.expect("Server error");
             });
         });
 
@@ -165,6 +262,17 @@ async fn actix_handler(req: HttpRequest, body: String) -> impl Responder {
     let method = req.method().as_str(); 
     let path = req.path();
 
+    if let Some(entry) = STATIC_ROUTES.get(&(method.to_string(), path.to_string())) {
+        let st = entry.value();
+        let mut builder = HttpResponse::build(StatusCode::from_u16(st.status).unwrap_or(StatusCode::OK));
+
+        for (k, v) in st.headers.iter() {
+            builder.insert_header((k.as_str(), v.as_str()));
+        }
+
+        return builder.body(st.body.clone());
+    }
+
     let route_cfg = if let Some(entry) = ROUTES.get(&(method.to_string(), path.to_string())) {
         Some(entry.value().clone())
     } else {
@@ -4,6 +4,7 @@ from .client import Client
 from .async_client import AsyncClient
 from .response import Response
 from .async_response import AsyncResponse
+from .pool import SessionPool, pool
 
 request       = Request
 client        = Client
@@ -1,19 +1,35 @@
 import time, os, json, asyncio
-from curl_cffi import requests, CurlMime
+from typing import Callable
+from curl_cffi import requests
 from .base_request import BaseRequest
+from .hooks import Lazy
+from .pool import pool
+from .multipart import ByteBudget, UploadProgress, part_size
 from .async_response import AsyncResponse
 from ..micro import func
 
 class AsyncRequest(BaseRequest):
 
+    def new_session ( self, curl_options: dict = None, max_clients: int = 10 ):
+
+        return requests.AsyncSession(**self.session_options(curl_options, max_clients=max_clients))
+
     def session ( self ):
 
         if self._session: return self._session
-        self._session = requests.AsyncSession(impersonate=self._impersonate)
+        self._session = self.new_session()
 
-        if self._proxy: self._session.proxies = {"http": self._proxy, "https": self._proxy}
         return self._session
 
+    async def send ( self, method: str, url: str, **options ):
+
+        if not self.pooled(): return await self.session().request(method, url, **options)
+
+        options["cookies"] = self.jar_cookies(url, options.get("cookies"))
+
+        with pool.alease(self.pool_key(url), self.new_session) as session:
+            return self.store_cookies(url, await session.request(method, url, **options))
+
     async def run_dependencies ( self, *args, endpoint: str = None, started_at: float = 0 ):
 
         if not self.check_limiter(endpoint, args[0]):
@@ -38,10 +54,10 @@ class AsyncRequest(BaseRequest):
 
         return True
 
-    async def execute ( self, method: str = None, endpoint: str = None, data: dict = None, graph: bool = False, *paths ):
+    async def execute ( self, method: str = None, endpoint: str = None, data: dict = None, graph: bool = False, *paths, progress: Callable = None ):
 
         method, url = self.resolve_method_url('post' if (paths or self._files) and not method else method, endpoint)
-        await self.adispatch('before', self.clone())
+        await self.adispatch('before', Lazy(self.clone))
 
         for attempt in range(self._max_retries + 1):
 
@@ -53,7 +69,7 @@ class AsyncRequest(BaseRequest):
                 await self.adispatch('error', {'error': {'message': 'The circuit breaker limit has been exceeded', 'code': 598}})
                 return AsyncResponse.__failed__(self, 598, None, None, time.perf_counter() - started_at)
 
-            if attempt: await self.adispatch('retry', self.clone())
+            if attempt: await self.adispatch('retry', Lazy(self.clone))
 
             try:
 
@@ -75,17 +91,18 @@ class AsyncRequest(BaseRequest):
                     for k, v in json_data.items():
                         parts.append({"name": k, "data": json.dumps(v) if isinstance(v, (dict, list, tuple, set)) else str(v)})
 
-                    mp = CurlMime.from_list(parts)
+                    mp = self.multipart(parts, progress)
+                    headers.update(mp.headers())
 
                 req_at = time.perf_counter()
 
-                res = await self.session().request(
+                res = await self.send(
                     method,
                     url,
-                    multipart=mp,
+                    content=mp,
                     headers=headers,
-                    params=json_params if not mp and method in ('GET', 'DELETE') else None,
-                    json=json_data if not mp and method not in ('GET', 'DELETE') else None,
+                    params=json_params if mp is None and method in ('GET', 'DELETE') else None,
+                    json=json_data if mp is None and method not in ('GET', 'DELETE') else None,
                     cookies=self._cookies,
                     timeout=self._timeout,
                     verify=self._verify,
@@ -105,7 +122,7 @@ class AsyncRequest(BaseRequest):
                 ended_at = time.perf_counter() - started_at
                 requested = True
 
-                await self.adispatch(['after', 'success'], AsyncResponse(self, res, url, method, elapsed, ended_at, True))
+                await self.adispatch(['after', 'success'], Lazy(AsyncResponse, self, res, url, method, elapsed, ended_at, True))
                 return AsyncResponse(self, res, url, method, elapsed, ended_at)
 
             except Exception as e:
@@ -121,18 +138,22 @@ class AsyncRequest(BaseRequest):
 
                 ended_at = time.perf_counter() - started_at
 
-                await self.adispatch('after', AsyncResponse.__failed__(self, 599, None, None, ended_at, True))
+                await self.adispatch('after', Lazy(AsyncResponse.__failed__, self, 599, None, None, ended_at, True))
                 return AsyncResponse.__failed__(self, 599, None, None, ended_at)
 
             finally:
                 try:
-                    if mp: await asyncio.to_thread(mp.close)
+                    if mp is not None: mp.close()
                 except: pass
 
-    async def download ( self, endpoint: str = None, path: str = None, method: str = None, stream: bool = True, resume: bool = True ):
+    async def download ( self, endpoint: str = None, path: str = None, method: str = None, stream: bool = True, resume: bool = True, segments: int = 1, checksum: str = None ):
 
         method, url = self.resolve_method_url(method, endpoint)
-        await self.adispatch('before', self.clone())
+        await self.adispatch('before', Lazy(self.clone))
+
+        if segments > 1 and method == 'GET':
+            res = await self.segmented(url, path, segments, checksum, endpoint)
+            if res is not None: return res
 
         for attempt in range(self._max_retries + 1):
 
@@ -143,7 +164,7 @@ class AsyncRequest(BaseRequest):
                 await self.adispatch('error', {'error': {'message': 'The circuit breaker limit has been exceeded', 'code': 598}})
                 return AsyncResponse.__failed__(self, 598, None, None, time.perf_counter() - started_at)
 
-            if attempt: await self.adispatch('retry', self.clone())
+            if attempt: await self.adispatch('retry', Lazy(self.clone))
 
             try:
 
@@ -164,7 +185,7 @@ class AsyncRequest(BaseRequest):
 
                 req_at = time.perf_counter()
 
-                res = await self.session().request(
+                res = await self.send(
                     method,
                     url,
                     headers=headers,
@@ -184,7 +205,7 @@ class AsyncRequest(BaseRequest):
                         headers.pop("Range", None)
                         start = 0
 
-                        res = await self.session().request(
+                        res = await self.send(
                             method,
                             url,
                             headers=headers,
@@ -202,7 +223,7 @@ class AsyncRequest(BaseRequest):
                         self.circuit_update(True)
 
                         ended_at = time.perf_counter() - started_at
-                        await self.adispatch('after', AsyncResponse(self, res, url, method, elapsed, ended_at, True))
+                        await self.adispatch('after', Lazy(AsyncResponse, self, res, url, method, elapsed, ended_at, True))
                         return AsyncResponse(self, res, url, method, elapsed, ended_at)
 
                 elapsed = time.perf_counter() - req_at
@@ -218,12 +239,16 @@ class AsyncRequest(BaseRequest):
                 ended_at = time.perf_counter() - started_at
                 requested = True
 
-                await self.adispatch('after', AsyncResponse(self, res, url, method, elapsed, ended_at, True))
+                await self.adispatch('after', Lazy(AsyncResponse, self, res, url, method, elapsed, ended_at, True))
                 res = AsyncResponse(self, res, url, method, elapsed, ended_at)
 
-                await res.save(path, stream=stream, on_progress=self._on_progress, start=start)
+                path = await res.save(path, stream=stream, on_progress=self._on_progress, start=start)
                 res._tt = time.perf_counter() - started_at
 
+                if checksum and not await asyncio.to_thread(self.verify_download, path, checksum):
+                    await self.adispatch('error', {'message': 'Checksum mismatch', 'code': 599})
+                    return AsyncResponse.__failed__(self, 599, f"Checksum mismatch for {path}", None, res._tt)
+
                 await self.adispatch('success', res)
                 return res
 
@@ -240,13 +265,106 @@ class AsyncRequest(BaseRequest):
 
                 ended_at = time.perf_counter() - started_at
 
-                await self.adispatch('after', AsyncResponse.__failed__(self, 599, None, None, ended_at, True))
+                await self.adispatch('after', Lazy(AsyncResponse.__failed__, self, 599, None, None, ended_at, True))
                 return AsyncResponse.__failed__(self, 599, None, None, ended_at)
 
+    async def segmented ( self, url: str, path: str = None, segments: int = 4, checksum: str = None, endpoint: str = None ):
+
+        if not hasattr(os, 'pwrite'): return None
+
+        started_at = time.perf_counter()
+        headers    = self.segment_headers()
+
+        dep = await self.run_dependencies(self, 'GET', url, endpoint=endpoint, started_at=started_at)
+        if isinstance(dep, AsyncResponse): return dep
+
+        try:
+            probe = await self.send('GET', url, headers={**headers, "Range": "bytes=0-0"}, params=self._params, cookies=self._cookies, timeout=self._timeout, verify=self._verify, stream=True)
+            await probe.aclose()
+        except Exception: return None
+
+        size   = self.range_size(probe)
+        ranges = self.split_ranges(size, segments) if size else []
+
+        if len(ranges) < 2: return None
+
+        elapsed  = time.perf_counter() - started_at
+        path, _  = AsyncResponse(self, probe, url, 'GET', elapsed, 0, True).resolve_path_ext(path)
+        fd       = self.preallocate(path, size)
+        progress = self.segment_progress(size)
+
+        try:
+            await asyncio.gather(*[self.fetch_segment(url, fd, *r, headers, progress) for r in ranges])
+
+        except Exception as e:
+            self.circuit_update(False)
+            await self.adispatch('error', {'message': 'Segmented download failed', 'code': 599, 'error': e})
+            return AsyncResponse.__failed__(self, 599, f"Segmented download failed: {e}", None, time.perf_counter() - started_at)
+
+        finally:
+            os.close(fd)
+
+        if not await asyncio.to_thread(self.verify_download, path, checksum, probe.headers):
+            os.remove(path)
+            await self.adispatch('error', {'message': 'Checksum mismatch', 'code': 599})
+            return AsyncResponse.__failed__(self, 599, f"Checksum mismatch for {path}", None, time.perf_counter() - started_at)
+
+        self.circuit_update(True)
+
+        res = AsyncResponse(self, self.assembled(probe, size), url, 'GET', elapsed, time.perf_counter() - started_at)
+        await self.adispatch(['after', 'success'], res)
+
+        return res
+
+    async def fetch_segment ( self, url: str, fd: int, first: int, last: int, headers: dict, progress: Callable ):
+
+        state, write, rewind = self.segment_writer(fd, first, last, progress)
+
+        for attempt in range(self._max_retries + 1):
+
+            res, start = None, state["offset"]
+
+            try:
+
+                res = await self.send('GET', url, headers={**headers, "Range": f"bytes={start}-{last}"}, params=self._params, cookies=self._cookies, timeout=self._timeout, verify=self._verify, content_callback=write)
+
+                if res.status_code != 206:
+                    rewind()
+                    raise IOError(f"Range {start}-{last} answered with {res.status_code}")
+
+                if state["offset"] <= last: raise IOError(f"Range {start}-{last} ended at {state['offset']}")
+                return last + 1 - first
+
+            except Exception as e:
+
+                if attempt >= self._max_retries: raise
+
+                await self.adispatch('error', {'message': f"Segment {first}-{last} failed", 'code': 599, 'error': e})
+                await self.adispatch('retry', Lazy(self.clone))
+                await asyncio.sleep(self.resolve_delay(attempt, res))
+
     async def upload ( self, *paths: str, endpoint: str = None, method: str = None, data: dict = None ):
 
         return await self.execute(method, endpoint, data, False, *paths)
 
+    async def upload_many ( self, *paths: str, endpoint: str = None, method: str = None, data: dict = None, concurrency: int = 4, budget: int = 256 * 1024 * 1024 ):
+
+        files     = self.resolve_files(*(self._files or []), *paths)
+        budget    = ByteBudget(budget)
+        progress  = UploadProgress(self, sum(part_size(f) for f in files))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def send ( part: dict ):
+
+            async with semaphore:
+
+                cost = await budget.aacquire(part_size(part))
+
+                try: return await self.clone().set(files=[]).execute(method, endpoint, data, False, part, progress=progress)
+                finally: await budget.arelease(cost)
+
+        return await asyncio.gather(*[send(part) for part in files])
+
     async def oauth2 ( self, client_id: str, client_secret: str, endpoint: str = 'oauth2/token', scope: str = '', grant: str = 'client_credentials', token_key: str = None, refresh_in: int = None ):
 
         self.set_basic_token(client_id, client_secret).set_data(grant_type=grant, scope=scope)
@@ -337,7 +455,7 @@ class AsyncRequest(BaseRequest):
         try: res = await self.call(method, endpoint)
         finally: self.set_stream(prev_stream)
 
-        async for chunk in res.aiter_content(chunk_size):
+        async for chunk in res.iter_content(chunk_size):
 
             if self._stop_stream:
                 self._stop_stream = False
@@ -10,7 +10,7 @@ class AsyncResponse(BaseResponse):
         if not self.raw(): return
 
         try:
-            async for chunk in self.raw().content.aiter_content(chunk_size):
+            async for chunk in self.raw().aiter_content(chunk_size):
                 yield chunk
         except Exception: return
 
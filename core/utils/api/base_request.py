@@ -1,6 +1,36 @@
-import os, base64, time, hashlib, copy, mimetypes, random, jwt, email.utils
+import os, io, base64, time, hashlib, copy, mimetypes, random, asyncio, threading, inspect, jwt, email.utils, email.message
+from http.cookiejar import CookieJar
+from urllib.request import Request as UrlRequest
+from urllib.response import addinfourl
 from typing import Any, Callable, Iterable
 from ..micro import func
+from .hooks import HookDispatcher, AsyncHookDispatcher, Lazy, EVENTS, resolve, is_async
+from .pool import pool
+from .multipart import MultipartStream, UploadProgress
+
+class Assembled:
+
+    __slots__ = ("status_code", "ok", "reason", "url", "headers", "text", "content")
+
+    def __init__ ( self, probe: Any, size: int ):
+
+        headers = {k: v for k, v in dict(getattr(probe, "headers", {}) or {}).items() if k.lower() not in ("content-range", "content-length")}
+
+        self.status_code = 200
+        self.ok          = True
+        self.reason      = "OK"
+        self.url         = getattr(probe, "url", None)
+        self.headers     = {**headers, "Content-Length": str(size)}
+        self.text        = ""
+        self.content     = b""
+
+    def iter_content ( self, chunk_size: int = None ):
+
+        return iter(())
+
+    async def aiter_content ( self, chunk_size: int = None ):
+
+        for chunk in (): yield chunk
 
 class BaseRequest:
 
@@ -31,6 +61,8 @@ class BaseRequest:
         self._verify           = True
         self._proxy            = None
         self._session          = None
+        self._pooled           = True
+        self._jar              = CookieJar()
         self._impersonate      = 'chrome120'
 
         self._headers          = {}
@@ -50,6 +82,9 @@ class BaseRequest:
         self._on_error         = []
         self._on_stream        = []
         self._on_progress      = []
+        self._hook_queue       = (1024, False)
+        self._dispatcher       = None
+        self._adispatcher      = None
 
         self._max_retries      = 0
         self._base_delay       = 0
@@ -78,8 +113,12 @@ class BaseRequest:
 
         instance = object.__new__(self.__class__)
 
-        safe_dict = {k: v for k, v in self.__dict__.items() if k not in ("_session", "_sse_buffer")}
+        safe_dict = {k: v for k, v in self.__dict__.items() if k not in ("_session", "_sse_buffer", "_dispatcher", "_adispatcher", "_jar")}
         instance.__dict__.update(copy.deepcopy(safe_dict) if deep else safe_dict)
+        instance._session     = None
+        instance._dispatcher  = None
+        instance._adispatcher = None
+        instance._jar         = self.copy_jar()
 
         return instance
 
@@ -133,6 +172,14 @@ class BaseRequest:
 
         return self
 
+    def set_hook_queue ( self, size: int = 1024, drop: bool = False ):
+
+        self._hook_queue  = (size, drop)
+        self._dispatcher  = None
+        self._adispatcher = None
+
+        return self
+
     def set_dependencies ( self, *fn: Callable, reset: bool = False ):
 
         if reset: self._deps = fn
@@ -190,6 +237,11 @@ class BaseRequest:
         self._impersonate = impersonate
         return self
 
+    def set_pooled ( self, pooled: bool = True ):
+
+        self._pooled = pooled
+        return self
+
     def set_retry ( self, max_retries: int = None, codes: Iterable = None, mode: str = None ):
 
         if max_retries is not None : self._max_retries = max_retries
@@ -386,6 +438,7 @@ class BaseRequest:
     def clear_cookies ( self ):
 
         self._cookies = {}
+        self._jar     = CookieJar()
         return self
 
     def clear_files ( self ):
@@ -452,6 +505,137 @@ class BaseRequest:
 
         return method, full_url
 
+    def segment_headers ( self ):
+
+        return {**self._headers, "Accept-Encoding": "identity", "Cache-Control": "no-transform"}
+
+    def range_size ( self, res: Any ):
+
+        total = str(getattr(res, 'headers', {}).get("Content-Range") or '').rpartition('/')[2]
+        return int(total) if getattr(res, 'status_code', 0) == 206 and total.isdigit() else None
+
+    def assembled ( self, probe: Any, size: int ):
+
+        return Assembled(probe, size)
+
+    def split_ranges ( self, size: int, segments: int, min_size: int = 1024 * 1024 ):
+
+        count = max(1, min(int(segments), size // max(1, min_size)))
+        step  = -(-size // count)
+
+        return [(start, min(size, start + step) - 1) for start in range(0, size, step)]
+
+    def preallocate ( self, path: str, size: int ):
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        os.ftruncate(fd, size)
+
+        try: os.posix_fallocate(fd, 0, size)
+        except (AttributeError, OSError): pass
+
+        return fd
+
+    def segment_writer ( self, fd: int, first: int, last: int, progress: Callable ):
+
+        state = {"offset": first}
+
+        def write ( chunk: bytes ):
+
+            offset = state["offset"]
+            data   = chunk[:max(0, last + 1 - offset)]
+
+            if data:
+                os.pwrite(fd, data, offset)
+                state["offset"] += len(data)
+                progress(len(data))
+
+            return len(chunk)
+
+        def rewind ():
+
+            progress(first - state["offset"])
+            state["offset"] = first
+
+        return state, write, rewind
+
+    def segment_progress ( self, size: int ):
+
+        state = {"done": 0, "reported": 0}
+        lock  = threading.Lock()
+
+        def advance ( n: int ):
+
+            with lock:
+
+                state["done"] += n
+                done = state["done"]
+
+                if abs(done - state["reported"]) < size * 0.01 and done < size: return
+                state["reported"] = done
+
+            self.progress(done, size)
+
+        return advance
+
+    def takes ( self, fn: Callable, count: int ):
+
+        try: inspect.signature(fn).bind(*range(count))
+        except (TypeError, ValueError): return False
+
+        return True
+
+    def progress ( self, sent: int, total: int, detail: dict = None ):
+
+        percent = (sent / total) * 100 if total else 100.0
+        calls   = [(fn, (sent, total, percent, detail) if detail is not None and self.takes(fn, 4) else (sent, total, percent), {}) for fn in self._on_progress if callable(fn)]
+
+        if calls: self.enqueue(calls)
+        return self
+
+    def multipart ( self, parts: list, progress: Callable = None ):
+
+        stream = MultipartStream(parts)
+        stream.progress = progress or UploadProgress(self, stream.payload())
+
+        return stream
+
+    def expected_digest ( self, checksum: str = None, headers: Any = None ):
+
+        if checksum:
+            algo, _, value = str(checksum).partition(':')
+            return (algo.lower().replace('-', ''), value.strip().lower()) if value else ('sha256', algo.strip().lower())
+
+        h = {str(k).lower(): str(v) for k, v in (headers or {}).items()}
+
+        for item in (h.get('repr-digest') or h.get('digest') or '').split(','):
+
+            algo, _, value = item.strip().partition('=')
+            algo = algo.lower().replace('-', '')
+
+            if algo not in ('sha256', 'sha512', 'sha1', 'md5') or not value: continue
+
+            try: return algo, base64.b64decode(value.strip(':')).hex()
+            except ValueError: continue
+
+        try: return ('md5', base64.b64decode(h['content-md5']).hex()) if h.get('content-md5') else None
+        except ValueError: return None
+
+    def file_digest ( self, path: str, algo: str, chunk_size: int = 1024 * 1024 ):
+
+        digest = hashlib.new(algo)
+
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''): digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def verify_download ( self, path: str, checksum: str = None, headers: Any = None ):
+
+        expected = self.expected_digest(checksum, headers)
+        return not expected or self.file_digest(path, expected[0]) == expected[1]
+
     def read_file ( self, path: str ):
 
         with open(path, 'rb') as f:
@@ -481,13 +665,25 @@ class BaseRequest:
             files.append({
                 "name": name,
                 "filename": filename,
-                "local_path": f if self._chunk else None,
-                "data": self.read_file(f) if not self._chunk else None,
+                "local_path": f,
                 "content_type": mimetypes.guess_type(f)[0] or "application/octet-stream"
             })
 
         return files
 
+    def object_part ( self, name: str, filename: str, fileobj: Any, content_type: str = None ):
+
+        path  = getattr(fileobj, "name", None)
+        local = path if self._chunk and isinstance(path, str) and os.path.isfile(path) and fileobj.tell() == 0 else None
+
+        return {
+            "name": name,
+            "filename": filename,
+            "local_path": local,
+            "fileobj": None if local else fileobj,
+            "content_type": content_type or "application/octet-stream"
+        }
+
     def resolve_files ( self, *paths ):
 
         files, unique, seen = [], [], set()
@@ -504,19 +700,7 @@ class BaseRequest:
 
                     if isinstance(val, tuple) and len(val) == 3 and getattr(val[1], "read", None):
 
-                        filename = val[0]
-                        fileobj  = val[1]
-                        mimetype = val[2] or "application/octet-stream"
-
-                        files.append({
-                            "name": key,
-                            "filename": filename,
-                            "local_path": fileobj.name if self._chunk else None,
-                            "data": fileobj.read() if not self._chunk else None,
-                            "content_type": mimetype
-                        })
-
-                        if not self._chunk: fileobj.seek(0)
+                        files.append(self.object_part(key, *val))
                         valid = False
 
                 if valid: files.append(item)
@@ -527,6 +711,9 @@ class BaseRequest:
             elif isinstance(item, os.PathLike):
                 files.extend(self.resolve_file(os.fspath(item)))
 
+            elif isinstance(item, tuple) and len(item) == 3 and getattr(item[1], "read", None):
+                files.append(self.object_part(os.path.splitext(item[0])[0], *item))
+
             elif isinstance(item, (list, tuple, set)):
 
                 for x in item:
@@ -536,45 +723,15 @@ class BaseRequest:
                     if isinstance(x, dict): files.append(x)
                     elif isinstance(x, (str, os.PathLike)): files.extend(self.resolve_file(os.fspath(x)))
                     elif isinstance(x, tuple) and len(x) == 3 and getattr(x[1], "read", None):
-
-                        files.append({
-                            "name": os.path.splitext(x[0])[0],
-                            "filename": x[0],
-                            "local_path": x[1].name if self._chunk else None,
-                            "data": x[1].read() if not self._chunk else None,
-                            "content_type": x[2] or "application/octet-stream"
-                        })
-
-                        if not self._chunk: x[1].seek(0)
-
-            elif isinstance(item, tuple) and len(item) == 3 and getattr(item[1], "read", None):
-
-                files.append({
-                    "name": os.path.splitext(item[0])[0],
-                    "filename": item[0],
-                    "local_path": item[1].name if self._chunk else None,
-                    "data": item[1].read() if not self._chunk else None,
-                    "content_type": item[2] or "application/octet-stream"
-                })
-                
-                if not self._chunk: item[1].seek(0)
+                        files.append(self.object_part(os.path.splitext(x[0])[0], *x))
 
             elif getattr(item, "read", None):
 
-                filename = os.path.basename(item.name)
-
-                files.append({
-                    "name": os.path.splitext(filename)[0],
-                    "filename": filename,
-                    "local_path": item.name if self._chunk else None,
-                    "data": item.read() if not self._chunk else None,
-                    "content_type": mimetypes.guess_type(filename)[0] or "application/octet-stream"
-                })
-
-                if not self._chunk: item.seek(0)
+                filename = os.path.basename(str(getattr(item, "name", "") or "file"))
+                files.append(self.object_part(os.path.splitext(filename)[0], filename, item, mimetypes.guess_type(filename)[0]))
 
         for f in files:
-            key = f.get("local_path") or (f.get("name"), f.get("filename"))
+            key = f.get("local_path") or (f.get("name"), f.get("filename"), id(f.get("fileobj")))
 
             if key not in seen:
                 seen.add(key)
@@ -736,44 +893,115 @@ class BaseRequest:
                 try: buf["retry"] = int(v)
                 except: pass
 
-    def dispatch ( self, event: str | list, *args, **kwargs ):
+    def pooled ( self ):
+
+        return self._pooled and pool.enabled and not self._session
+
+    def pool_key ( self, url: str ):
+
+        return pool.key(url, self._proxy, self._impersonate, self._verify)
+
+    def session_options ( self, curl_options: dict = None, **options: Any ):
+
+        if self._proxy: options["proxies"] = {'http': self._proxy, 'https': self._proxy}
+        if curl_options: options.update(curl_options=curl_options, discard_cookies=True)
+
+        return {"impersonate": self._impersonate, **options}
+
+    def copy_jar ( self ):
+
+        jar = CookieJar()
+        for cookie in self._jar: jar.set_cookie(copy.copy(cookie))
+
+        return jar
+
+    def jar_cookies ( self, url: str, cookies: dict = None ):
+
+        request = UrlRequest(url)
+        self._jar.add_cookie_header(request)
+
+        pairs = [p.split("=", 1) for p in (request.get_header("Cookie") or "").split("; ") if p]
+        return {**{p[0]: p[1] if len(p) > 1 else "" for p in pairs}, **(cookies or {})}
+
+    def store_cookies ( self, url: str, res: Any ):
+
+        try: found = res.headers.get_list("set-cookie")
+        except Exception: found = []
+
+        if not found: return res
+
+        final   = str(getattr(res, "url", None) or url)
+        headers = email.message.Message()
+
+        for value in found: headers["Set-Cookie"] = value
+
+        self._jar.extract_cookies(addinfourl(io.BytesIO(), headers, final), UrlRequest(final))
+        return res
+
+    def dispatcher ( self ):
+
+        if self._dispatcher is None: self._dispatcher = HookDispatcher(*self._hook_queue)
+        return self._dispatcher
+
+    def hook_calls ( self, event: str | list, args: tuple, kwargs: dict ):
 
         events = event if isinstance(event, list) else [event]
+        hooks  = [fn for ev in events if ev in EVENTS for fn in getattr(self, f"_on_{ev}") if callable(fn)]
+
+        if not hooks: return []
+
+        args, kwargs = resolve(args, kwargs)
+        return [(fn, args, kwargs) for fn in hooks]
+
+    def adispatcher ( self ):
+
+        loop = asyncio.get_running_loop()
 
-        for ev in events:
+        if self._adispatcher is None or self._adispatcher.loop is not loop: self._adispatcher = AsyncHookDispatcher(*self._hook_queue)
+        return self._adispatcher
 
-            if ev == 'before':     hooks = self._on_before
-            elif ev == 'after':    hooks = self._on_after
-            elif ev == 'retry':    hooks = self._on_retry
-            elif ev == 'success':  hooks = self._on_success
-            elif ev == 'error':    hooks = self._on_error
-            elif ev == 'stream':   hooks = self._on_stream
-            elif ev == 'progress': hooks = self._on_progress
-            else: continue
+    def split_calls ( self, calls: list ):
 
-            for fn in hooks:
-                if callable(fn):
-                    func.thread(fn, *args, **kwargs)
+        try: asyncio.get_running_loop()
+        except RuntimeError: return calls, []
+
+        return [c for c in calls if not is_async(c[0])], [c for c in calls if is_async(c[0])]
+
+    def enqueue ( self, calls: list ):
+
+        sync, coros = self.split_calls(calls)
+
+        if coros: self.adispatcher().put_nowait(coros)
+        if sync: self.dispatcher().put(sync)
 
         return self
 
-    async def adispatch ( self, event: str | list, *args, **kwargs ):
+    def dispatch ( self, event: str | list, *args, **kwargs ):
 
-        events = event if isinstance(event, list) else [event]
+        calls = self.hook_calls(event, args, kwargs)
+        if calls: self.dispatcher().put(calls)
+
+        return self
 
-        for ev in events:
+    async def adispatch ( self, event: str | list, *args, **kwargs ):
 
-            if ev == 'before':     hooks = self._on_before
-            elif ev == 'after':    hooks = self._on_after
-            elif ev == 'retry':    hooks = self._on_retry
-            elif ev == 'success':  hooks = self._on_success
-            elif ev == 'error':    hooks = self._on_error
-            elif ev == 'stream':   hooks = self._on_stream
-            elif ev == 'progress': hooks = self._on_progress
-            else: continue
+        sync, coros = self.split_calls(self.hook_calls(event, args, kwargs))
 
-            for fn in hooks:
-                if callable(fn):
-                    await func.athread(fn, *args, **kwargs)
+        if coros: await self.adispatcher().put(coros)
+        if sync and not self.dispatcher().put(sync, block=False): await asyncio.to_thread(self.dispatcher().put, sync)
 
         return self
+
+    def flush_hooks ( self, timeout: float = None ):
+
+        return self._dispatcher.join(timeout) if self._dispatcher else True
+
+    async def aflush_hooks ( self, timeout: float = None ):
+
+        async def flush ():
+
+            if self._adispatcher is not None and self._adispatcher.loop is asyncio.get_running_loop(): await self._adispatcher.join()
+            return await asyncio.to_thread(self.flush_hooks, timeout) if self._dispatcher else True
+
+        try: return await asyncio.wait_for(flush(), timeout)
+        except asyncio.TimeoutError: return False
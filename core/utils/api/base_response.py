@@ -3,30 +3,47 @@ from .errors import RateLimitError, GatewayError, ServerError, ValidationError,
 from .errors import CircuitBreakerError, DependenciesFailedError, DependenciesRuntimeError, UnexpectedError
 from bs4 import BeautifulSoup
 from typing import Any
-import json, os, time, copy, yaml, xml.etree.ElementTree as ET, csv, io, base64
+import json, os, time, copy, yaml, orjson, xml.etree.ElementTree as ET, csv, io, base64
+
+CONTEXT = {'success': False, 'status': None, 'message': '', 'errors': {}}
+
+def lazy ( name: str, loader: str ):
+
+    def get ( self ):
+
+        if name not in self._cache: getattr(self, loader)()
+        return self._cache[name]
+
+    def put ( self, value ):
+
+        self._cache[name] = value
+
+    return property(get, put)
 
 class BaseResponse:
 
+    _text    = lazy('text', 'load_text')
+    _json    = lazy('json', 'load_json')
+    _headers = lazy('headers', 'load_headers')
+    _success = lazy('success', 'load_context')
+    _status  = lazy('status', 'load_context')
+    _message = lazy('message', 'load_context')
+    _errors  = lazy('errors', 'load_context')
+
     def __init__ ( self, request, res = None, url: str = None, method: str = None, rt: float = None, tt: float = None, handler: bool = False ):
 
-        self._request = request.clone()
+        self._request = request
         self._url     = url or getattr(request, '_base_url', '')
         self._method  = method
         self._handle  = handler
         self._rt      = float(rt or 0)
         self._tt      = float(tt or 0)
         self._ok      = False
-        self._success = False
         self._soup    = None
         self._raw     = None
         self._code    = None
-        self._status  = None
         self._token   = None
-        self._text    = None
-        self._message = ''
-        self._json    = {}
-        self._headers = {}
-        self._errors  = {}
+        self._cache   = {}
 
         if res: self.set_response(res)
 
@@ -93,22 +110,38 @@ class BaseResponse:
 
     def set_response ( self, res ):
 
-        self._raw     = res
-        self._ok      = bool(getattr(res, 'ok', False) or False)
-        self._code    = int(getattr(res, 'status_code', 0) or 0)
-        self._url     = str(getattr(res, 'url', '') or '')
-        self._text    = str(getattr(res, 'text', '') or '')
-        self._headers = dict(getattr(res, 'headers', {}) or {})
+        self._raw   = res
+        self._cache = {}
+        self._ok    = bool(getattr(res, 'ok', False) or False)
+        self._code  = int(getattr(res, 'status_code', 0) or 0)
+        self._url   = str(getattr(res, 'url', '') or '')
+
+        return self if self._handle or getattr(self._request, '_handle_errors', None) else self.raise_errors()
+
+    def load_text ( self ):
+
+        self._text = str(getattr(self._raw, 'text', '') or '') if self._raw is not None else None
 
-        try: self._json = res.json()
-        except ValueError: self._json = json.loads(res.text) if res.text.strip().startswith('{') else {}
-        except Exception: self._json = {}
+    def load_json ( self ):
+
+        body = self.bytes().strip()
+
+        try: self._json = orjson.loads(body) if body else {}
+        except orjson.JSONDecodeError:
+            try: self._json = json.loads(self.text()) if self.text().startswith(('{', '[')) else {}
+            except ValueError: self._json = {}
+
+    def load_headers ( self ):
+
+        self._headers = dict(getattr(self._raw, 'headers', {}) or {})
+
+    def load_context ( self ):
+
+        for k, v in CONTEXT.items(): self._cache.setdefault(k, copy.copy(v))
 
         try: self.set_context()
         except: pass
 
-        return self if self._handle or getattr(self._request, '_handle_errors', None) else self.raise_errors()
-
     def set_context ( self ):
 
         if not isinstance(self._json, dict):
@@ -148,12 +181,12 @@ class BaseResponse:
     def raise_errors ( self ):
 
         code = self.code()
+        if 200 <= code < 300: return self
+
         text = self.text().lower()
 
         msg = self.message()
         msg = msg if msg and msg.strip().lower() not in ("success", "failed") else None
-
-        if 200 <= code < 300: return self
         if code == 599: raise NetworkError(msg, self)
         if code == 598: raise CircuitBreakerError(msg, self)
         if code == 597: raise DependenciesRuntimeError(msg, self)
@@ -201,6 +201,10 @@ class Client:
 
         return self.req.upload(*files, endpoint=endpoint, data=data)
 
+    def upload_many ( self, *files, endpoint: str = None, data: dict = None, concurrency: int = 4, budget: int = 256 * 1024 * 1024 ):
+
+        return self.req.upload_many(*files, endpoint=endpoint, data=data, concurrency=concurrency, budget=budget)
+
     def download ( self, endpoint: str, path: str, resume: bool = True ):
 
         return self.req.download(endpoint, path, resume=resume)
@@ -0,0 +1,192 @@
+from collections import deque
+from typing import Any, Callable
+import threading, asyncio, inspect
+from ..micro import func
+
+EVENTS = ('before', 'after', 'retry', 'success', 'error', 'stream', 'progress')
+
+class Lazy:
+
+    __slots__ = ("fn", "args", "kwargs")
+
+    def __init__ ( self, fn: Callable, *args, **kwargs ):
+
+        self.fn     = fn
+        self.args   = args
+        self.kwargs = kwargs
+
+    def __call__ ( self ):
+
+        return self.fn(*self.args, **self.kwargs)
+
+def resolve ( args: tuple, kwargs: dict ):
+
+    args   = tuple(a() if isinstance(a, Lazy) else a for a in args)
+    kwargs = {k: v() if isinstance(v, Lazy) else v for k, v in kwargs.items()}
+
+    return args, kwargs
+
+def is_async ( fn: Callable ):
+
+    return inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(getattr(fn, "__call__", None))
+
+class HookDispatcher:
+
+    def __init__ ( self, maxsize: int = 1024, drop: bool = False ):
+
+        self.maxsize   = max(1, int(maxsize))
+        self.drop      = drop
+        self.queue     = deque()
+        self.cond      = threading.Condition()
+        self.running   = False
+        self.owner     = None
+        self.delivered = 0
+        self.dropped   = 0
+
+    def put ( self, calls: list, block: bool = True ):
+
+        with self.cond:
+
+            full = lambda: self.queue and len(self.queue) + len(calls) > self.maxsize
+
+            if not self.drop and full() and threading.get_ident() != self.owner:
+                if not block: return False
+                self.cond.wait_for(lambda: not full())
+
+            for call in calls:
+
+                if self.drop and len(self.queue) >= self.maxsize:
+                    self.dropped += 1
+                    continue
+
+                self.queue.append(call)
+
+            start = bool(self.queue) and not self.running
+            if start: self.running = True
+
+        if start: func.thread(self.drain)
+        return True
+
+    def drain ( self ):
+
+        self.owner = threading.get_ident()
+
+        while True:
+
+            with self.cond:
+
+                if not self.queue:
+                    self.running, self.owner = False, None
+                    self.cond.notify_all()
+                    return True
+
+                batch = list(self.queue)
+                self.queue.clear()
+                self.cond.notify_all()
+
+            for fn, args, kwargs in batch:
+
+                try: func.execute(fn, *args, **kwargs)
+                except Exception: pass
+
+                self.delivered += 1
+
+    def join ( self, timeout: float = None ):
+
+        with self.cond:
+            return self.cond.wait_for(lambda: not self.queue and not self.running, timeout)
+
+    def stats ( self ):
+
+        return {
+            "pending"   : len(self.queue),
+            "delivered" : self.delivered,
+            "dropped"   : self.dropped,
+            "maxsize"   : self.maxsize,
+            "drop"      : self.drop,
+        }
+
+class AsyncHookDispatcher:
+
+    def __init__ ( self, maxsize: int = 1024, drop: bool = False ):
+
+        self.maxsize   = max(1, int(maxsize))
+        self.drop      = drop
+        self.loop      = asyncio.get_running_loop()
+        self.queue     = deque()
+        self.waiters   = []
+        self.task      = None
+        self.running   = False
+        self.delivered = 0
+        self.dropped   = 0
+
+    def full ( self, count: int ):
+
+        return bool(self.queue) and len(self.queue) + count > self.maxsize
+
+    def put_nowait ( self, calls: list ):
+
+        for call in calls:
+
+            if self.drop and len(self.queue) >= self.maxsize:
+                self.dropped += 1
+                continue
+
+            self.queue.append(call)
+
+        if self.queue and not self.running:
+            self.running = True
+            self.task    = self.loop.create_task(self.drain())
+
+        return True
+
+    async def put ( self, calls: list ):
+
+        while not self.drop and self.full(len(calls)) and asyncio.current_task() is not self.task:
+
+            waiter = self.loop.create_future()
+            self.waiters.append(waiter)
+
+            await waiter
+
+        return self.put_nowait(calls)
+
+    def wake ( self ):
+
+        for waiter in self.waiters:
+            if not waiter.done(): waiter.set_result(True)
+
+        self.waiters.clear()
+
+    async def drain ( self ):
+
+        while self.queue:
+
+            batch = list(self.queue)
+            self.queue.clear()
+            self.wake()
+
+            for fn, args, kwargs in batch:
+
+                try: await fn(*args, **kwargs)
+                except Exception as e: self.loop.call_exception_handler({"message": f"Hook {getattr(fn, '__name__', fn)!r} failed", "exception": e})
+
+                self.delivered += 1
+
+        self.running = False
+        self.wake()
+
+    async def join ( self ):
+
+        while self.running: await asyncio.shield(self.task)
+        return True
+
+    def stats ( self ):
+
+        return {
+            "pending"   : len(self.queue),
+            "delivered" : self.delivered,
+            "dropped"   : self.dropped,
+            "maxsize"   : self.maxsize,
+            "drop"      : self.drop,
+        }
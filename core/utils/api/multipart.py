@@ -0,0 +1,268 @@
+from typing import Any, Callable
+import os, io, uuid, mmap, asyncio, threading
+
+WINDOW = 4 * 1024 * 1024 // mmap.ALLOCATIONGRANULARITY * mmap.ALLOCATIONGRANULARITY or mmap.ALLOCATIONGRANULARITY
+
+def quote ( value: str ):
+
+    return str(value).replace("\\", "\\\\").replace('"', '%22').replace("\r", "%0D").replace("\n", "%0A")
+
+class Segment:
+
+    __slots__ = ("size", "data", "path", "fileobj", "start", "label", "fh", "mm", "base")
+
+    def __init__ ( self, size: int, data: bytes = None, path: str = None, fileobj: Any = None, start: int = 0, label: str = None ):
+
+        self.size    = size
+        self.data    = data
+        self.path    = path
+        self.fileobj = fileobj
+        self.start   = start
+        self.label   = label
+        self.fh      = None
+        self.mm      = None
+        self.base    = 0
+
+    def window ( self, offset: int ):
+
+        if self.mm is not None and self.base <= offset < self.base + len(self.mm): return self.mm
+        if self.mm is not None: self.mm.close()
+
+        self.base = offset - offset % mmap.ALLOCATIONGRANULARITY
+
+        try: self.mm = mmap.mmap(self.fh.fileno(), min(WINDOW, self.size - self.base), access=mmap.ACCESS_READ, offset=self.base)
+        except (OSError, ValueError): self.mm = None
+
+        return self.mm
+
+    def read ( self, offset: int, n: int ):
+
+        if self.data is not None: return self.data[offset:offset + n]
+
+        if self.fileobj is not None:
+            self.fileobj.seek(self.start + offset)
+            return self.fileobj.read(n)
+
+        if self.fh is None: self.fh = open(self.path, 'rb')
+
+        mm = self.window(offset)
+
+        if mm is not None: return mm[offset - self.base:offset - self.base + n]
+
+        self.fh.seek(offset)
+        return self.fh.read(n)
+
+    def close ( self ):
+
+        if self.mm is not None: self.mm.close()
+        if self.fh is not None: self.fh.close()
+
+        self.fh, self.mm, self.base = None, None, 0
+
+class MultipartStream:
+
+    def __init__ ( self, parts: list, progress: Callable = None, boundary: str = None ):
+
+        self.boundary = boundary or uuid.uuid4().hex
+        self.progress = progress
+        self.segments = []
+        self.files    = {}
+        self.pos      = 0
+
+        for part in parts: self.add(part)
+
+        tail      = f"--{self.boundary}--\r\n".encode()
+        self.size = sum(s.size for s in self.segments) + len(tail)
+
+        self.segments.append(Segment(len(tail), tail))
+
+    def header ( self, part: dict ):
+
+        name, filename = part.get("name") or "file", part.get("filename")
+        lines = [f"--{self.boundary}", f'Content-Disposition: form-data; name="{quote(name)}"' + (f'; filename="{quote(filename)}"' if filename else '')]
+
+        if part.get("content_type") or filename: lines.append(f"Content-Type: {part.get('content_type') or 'application/octet-stream'}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+    def body ( self, part: dict ):
+
+        label, path, fileobj, data = part.get("filename") or part.get("name"), part.get("local_path"), part.get("fileobj"), part.get("data")
+
+        if path: return Segment(os.path.getsize(path), path=path, label=label)
+
+        if fileobj is None:
+            data = data if isinstance(data, (bytes, bytearray)) else str(data or '').encode()
+            return Segment(len(data), data, label=label)
+
+        try:
+            start = fileobj.tell()
+            size  = fileobj.seek(0, io.SEEK_END) - start
+            fileobj.seek(start)
+
+        except (AttributeError, OSError):
+            data = fileobj.read()
+            return Segment(len(data), data, label=label)
+
+        return Segment(size, fileobj=fileobj, start=start, label=label)
+
+    def add ( self, part: dict ):
+
+        head, body = self.header(part), self.body(part)
+
+        self.segments.append(Segment(len(head), head))
+        self.segments.append(body)
+        self.segments.append(Segment(2, b"\r\n"))
+
+        if part.get("filename"): self.files[id(body)] = [body.label, 0, body.size]
+        return self
+
+    def payload ( self ):
+
+        return sum(entry[2] for entry in self.files.values())
+
+    def headers ( self ):
+
+        return {"Content-Type": f"multipart/form-data; boundary={self.boundary}", "Content-Length": str(self.size)}
+
+    def seekable ( self ):
+
+        return True
+
+    def tell ( self ):
+
+        return self.pos
+
+    def seek ( self, offset: int, whence: int = io.SEEK_SET ):
+
+        base     = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: self.size}[whence]
+        self.pos = max(0, min(self.size, base + offset))
+
+        return self.pos
+
+    def locate ( self, pos: int ):
+
+        start = 0
+
+        for index, segment in enumerate(self.segments):
+            if pos < start + segment.size: return index, pos - start
+            start += segment.size
+
+        return len(self.segments), 0
+
+    def read ( self, n: int = -1 ):
+
+        if n is None or n < 0: n = self.size - self.pos
+        if n <= 0 or self.pos >= self.size: return b""
+
+        index, offset = self.locate(self.pos)
+        segment       = self.segments[index]
+        chunk         = segment.read(offset, min(n, segment.size - offset))
+
+        self.pos += len(chunk)
+
+        if offset + len(chunk) >= segment.size: segment.close()
+        if len(chunk) and id(segment) in self.files: self.advance(segment, offset + len(chunk))
+
+        return chunk
+
+    def advance ( self, segment: Segment, done: int ):
+
+        entry    = self.files[id(segment)]
+        sent     = max(0, done - entry[1])
+        entry[1] = max(entry[1], done)
+
+        if not sent or not callable(self.progress): return
+        self.progress(sent, {"file": entry[0], "sent": entry[1], "size": entry[2]})
+
+    def close ( self ):
+
+        for segment in self.segments: segment.close()
+
+    def __len__ ( self ):
+
+        return self.size
+
+def part_size ( part: dict ):
+
+    if part.get("local_path"): return os.path.getsize(part["local_path"])
+    if part.get("fileobj") is None: return len(part.get("data") or b"")
+
+    try:
+        fileobj = part["fileobj"]
+        start   = fileobj.tell()
+        size    = fileobj.seek(0, io.SEEK_END) - start
+        fileobj.seek(start)
+
+    except (AttributeError, OSError): return 0
+
+    return size
+
+class ByteBudget:
+
+    def __init__ ( self, limit: int = 256 * 1024 * 1024 ):
+
+        self.limit  = max(1, int(limit))
+        self.used   = 0
+        self.cond   = threading.Condition()
+        self.acond  = None
+
+    def cost ( self, size: int ):
+
+        return min(max(1, int(size or 0)), self.limit)
+
+    def acquire ( self, size: int ):
+
+        cost = self.cost(size)
+
+        with self.cond:
+            self.cond.wait_for(lambda: self.used + cost <= self.limit)
+            self.used += cost
+
+        return cost
+
+    def release ( self, cost: int ):
+
+        with self.cond:
+            self.used -= cost
+            self.cond.notify_all()
+
+    async def aacquire ( self, size: int ):
+
+        cost = self.cost(size)
+        if self.acond is None: self.acond = asyncio.Condition()
+
+        async with self.acond:
+            await self.acond.wait_for(lambda: self.used + cost <= self.limit)
+            self.used += cost
+
+        return cost
+
+    async def arelease ( self, cost: int ):
+
+        async with self.acond:
+            self.used -= cost
+            self.acond.notify_all()
+
+class UploadProgress:
+
+    def __init__ ( self, request: Any, total: int ):
+
+        self.request  = request
+        self.total    = max(0, int(total))
+        self.sent     = 0
+        self.reported = 0
+        self.lock     = threading.Lock()
+
+    def __call__ ( self, n: int, detail: dict = None ):
+
+        with self.lock:
+
+            self.sent += n
+            sent = self.sent
+
+            done = detail and detail["sent"] >= detail["size"]
+            if not done and sent - self.reported < self.total * 0.01 and sent < self.total: return
+
+            self.reported = sent
+
+        self.request.progress(sent, self.total, detail)
@@ -0,0 +1,297 @@
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from typing import Any, Callable
+import os, time, asyncio, threading, atexit
+from curl_cffi import CurlOpt
+
+PORTS = {"http": 80, "https": 443}
+
+class Pooled:
+
+    __slots__ = ("session", "loop", "created", "used", "active", "requests")
+
+    def __init__ ( self, session: Any, loop: Any = None ):
+
+        self.session  = session
+        self.loop     = loop
+        self.created  = time.monotonic()
+        self.used     = self.created
+        self.active   = 0
+        self.requests = 0
+
+class SessionPool:
+
+    def __init__ ( self, per_host: int = 10, idle: float = 60, max_age: float = 600, max_requests: int = 0, wait: float = None ):
+
+        self.per_host     = per_host
+        self.idle         = idle
+        self.max_age      = max_age
+        self.max_requests = max_requests
+        self.wait         = wait
+        self.cond         = threading.Condition()
+        self.pid          = None
+        self.swept        = time.monotonic()
+        self.enabled      = True
+
+        self.reset()
+        atexit.register(self.clear)
+
+    def reset ( self ):
+
+        self.pid       = os.getpid()
+        self.idle_sync = {}
+        self.leased    = {}
+        self.shared    = {}
+        self.created   = 0
+        self.reused    = 0
+        self.expired   = 0
+        self.discarded = 0
+        self.waits     = 0
+
+        return self
+
+    def configure ( self, per_host: int = None, idle: float = None, max_age: float = None, max_requests: int = None, wait: float = None, enabled: bool = None ):
+
+        self.clear()
+
+        if per_host is not None:     self.per_host = max(1, int(per_host))
+        if idle is not None:         self.idle = idle
+        if max_age is not None:      self.max_age = max_age
+        if max_requests is not None: self.max_requests = max_requests
+        if wait is not None:         self.wait = wait
+        if enabled is not None:      self.enabled = enabled
+
+        return self
+
+    def key ( self, url: str, proxy: str = None, impersonate: str = None, verify: bool = True ):
+
+        parts  = urlsplit(url)
+        scheme = (parts.scheme or "https").lower()
+
+        return (scheme, (parts.hostname or "").lower(), parts.port or PORTS.get(scheme), proxy, impersonate, bool(verify))
+
+    def curl_options ( self ):
+
+        return {CurlOpt.MAXAGE_CONN: max(1, int(self.idle)), CurlOpt.MAXLIFETIME_CONN: max(0, int(self.max_age or 0))}
+
+    def healthy ( self, entry: Pooled, now: float ):
+
+        if getattr(entry.session, "_closed", False): return False
+        if entry.loop is not None and entry.loop.is_closed(): return False
+        if self.idle and now - entry.used > self.idle: return False
+        if self.max_age and now - entry.created > self.max_age: return False
+        if self.max_requests and entry.requests >= self.max_requests: return False
+
+        return True
+
+    def check ( self ):
+
+        if self.pid != os.getpid():
+            with self.cond: self.reset()
+
+        return self
+
+    def acquire ( self, key: tuple, factory: Callable, timeout: float = None ):
+
+        self.check()
+        if self.idle and time.monotonic() - self.swept > self.idle: self.sweep()
+
+        wait     = timeout if timeout is not None else self.wait or 3600
+        deadline = time.monotonic() + wait
+        stale    = []
+
+        with self.cond:
+
+            while True:
+
+                now  = time.monotonic()
+                idle = self.idle_sync.setdefault(key, [])
+
+                while idle:
+
+                    entry = idle.pop()
+
+                    if self.healthy(entry, now):
+                        self.reused += 1
+                        break
+
+                    self.expired += 1
+                    stale.append(entry)
+                    entry = None
+
+                else: entry = None
+
+                if entry is not None or self.leased.get(key, 0) + len(idle) < self.per_host: break
+
+                self.waits += 1
+                if not self.cond.wait(deadline - now) and time.monotonic() >= deadline: raise TimeoutError(f"No pooled session for {key[1]}:{key[2]} within {wait}s")
+
+            self.leased[key] = self.leased.get(key, 0) + 1
+
+        self.close(stale)
+
+        if entry is None:
+
+            try: entry = Pooled(factory(self.curl_options()))
+            except BaseException:
+                self.release(key, None)
+                raise
+
+            self.created += 1
+
+        entry.active   = 1
+        entry.requests += 1
+
+        return entry
+
+    def release ( self, key: tuple, entry: Pooled = None, ok: bool = True ):
+
+        discard = None
+
+        with self.cond:
+
+            self.leased[key] = max(0, self.leased.get(key, 0) - 1)
+
+            if entry is not None:
+
+                entry.active, entry.used = 0, time.monotonic()
+
+                if ok and self.pid == os.getpid(): self.idle_sync.setdefault(key, []).append(entry)
+                else: discard = entry
+
+                if not ok: self.discarded += 1
+
+            self.cond.notify()
+
+        if discard: self.close([discard])
+        return self
+
+    @contextmanager
+    def lease ( self, key: tuple, factory: Callable, timeout: float = None ):
+
+        entry = self.acquire(key, factory, timeout)
+        ok    = False
+
+        try:
+            yield entry.session
+            ok = True
+
+        finally:
+            self.release(key, entry, ok)
+
+    def shared_session ( self, key: tuple, factory: Callable ):
+
+        self.check()
+
+        loop  = asyncio.get_running_loop()
+        slot  = (*key, id(loop))
+        now   = time.monotonic()
+        stale = None
+
+        if slot not in self.shared or (self.idle and now - self.swept > self.idle): self.sweep()
+
+        with self.cond:
+
+            entry = self.shared.get(slot)
+
+            if entry is not None and entry.loop is loop and (entry.active or self.healthy(entry, now)): self.reused += 1
+            else:
+
+                if entry is not None:
+                    self.expired += 1
+                    stale = entry
+
+                entry = self.shared[slot] = Pooled(factory(self.curl_options(), self.per_host), loop)
+                self.created += 1
+
+            entry.active   += 1
+            entry.requests += 1
+
+        if stale: self.close([stale])
+        return entry
+
+    def unshare ( self, entry: Pooled ):
+
+        with self.cond: entry.active, entry.used = max(0, entry.active - 1), time.monotonic()
+        return self
+
+    @contextmanager
+    def alease ( self, key: tuple, factory: Callable ):
+
+        entry = self.shared_session(key, factory)
+
+        try: yield entry.session
+        finally: self.unshare(entry)
+
+    def close ( self, entries: list ):
+
+        for entry in entries:
+
+            try:
+                if entry.loop is None: entry.session.close()
+                elif entry.loop.is_closed(): self.finish(entry.session.close())
+                else: asyncio.run_coroutine_threadsafe(entry.session.close(), entry.loop)
+            except Exception: pass
+
+        return self
+
+    def finish ( self, coro: Any ):
+
+        # The owning loop is gone, so drive the close coroutine by hand; it only
+        # awaits the already cancelled timeout task before freeing the curl handles.
+        try: coro.send(None)
+        except StopIteration: return True
+
+        coro.close()
+        return False
+
+    def sweep ( self ):
+
+        self.check()
+        now, stale = time.monotonic(), []
+        self.swept = now
+
+        with self.cond:
+
+            for key, idle in self.idle_sync.items():
+                stale += [e for e in idle if not self.healthy(e, now)]
+                idle[:] = [e for e in idle if e not in stale]
+
+            for slot, entry in list(self.shared.items()):
+                if entry.loop.is_closed() or (not entry.active and not self.healthy(entry, now)):
+                    stale.append(self.shared.pop(slot))
+
+            self.expired += len(stale)
+
+        self.close(stale)
+        return len(stale)
+
+    def clear ( self ):
+
+        with self.cond:
+
+            entries = [e for idle in self.idle_sync.values() for e in idle] + [e for e in self.shared.values() if not e.active]
+
+            self.idle_sync = {}
+            self.shared    = {k: e for k, e in self.shared.items() if e.active}
+
+        if self.pid == os.getpid(): self.close(entries)
+        return self
+
+    def stats ( self ):
+
+        with self.cond:
+
+            return {
+                "hosts"     : len({k[:3] for k in [*self.idle_sync, *self.leased, *[s[:-1] for s in self.shared]]}),
+                "idle"      : sum(len(v) for v in self.idle_sync.values()),
+                "leased"    : sum(self.leased.values()),
+                "shared"    : len(self.shared),
+                "created"   : self.created,
+                "reused"    : self.reused,
+                "expired"   : self.expired,
+                "discarded" : self.discarded,
+                "waits"     : self.waits,
+            }
+
+pool = SessionPool(int(os.environ.get("APP_HTTP_POOL_SIZE", 10)), float(os.environ.get("APP_HTTP_POOL_IDLE", 60)))
@@ -3,6 +3,7 @@ from .func import Func
 from .string import String
 from .iters import Iters
 from .cast import Cast
+from .loop import Loops, loops
 
 module = Modules()
 func   = Func()
@@ -1,6 +1,7 @@
 import asyncio, inspect, functools, time, concurrent.futures, atexit, os, threading
 from typing import Any, Callable, Iterable, get_type_hints
 from .module import Modules
+from .loop import loops
 
 class Func:
 
@@ -142,54 +143,9 @@ class Func:
         return self.return_annotation(fn) in (None, inspect._empty)
 
 
-    def _run_loop_isolated ( self, coro ):
-
-        result, error, event = None, None, threading.Event()
-
-        def runner():
-
-            nonlocal result, error
-
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                result = loop.run_until_complete(coro)
-
-            except Exception as e:
-                error = e
-
-            finally:
-                try: loop.close()
-                except: pass
-                event.set()
-
-        thread = threading.Thread(target=runner, daemon=True)
-        thread.start()
-        event.wait()
-
-        if error: raise error
-        return result
-
-    def _run_new_loop ( self, coro ):
-
-        try: return asyncio.run(coro)
-        except RuntimeError: return self._run_loop_isolated(coro)
-
     def _safe_run_coro ( self, coro ):
 
-        try: loop = asyncio.get_running_loop()
-        except RuntimeError: loop = None
-
-        if loop and loop.is_running():
-
-            if loop.is_closed(): return self._run_new_loop(coro)
-            future = asyncio.run_coroutine_threadsafe(coro, loop)
-
-            try: return future.result()
-            except Exception: return self._run_new_loop(coro)
-
-        if loop and not loop.is_running(): return self._run_new_loop(coro)
-        return self._run_new_loop(coro)
+        return loops.run(coro)
 
     def execute ( self, fn: Callable, *args, **kwargs ):
      
@@ -0,0 +1,126 @@
+import asyncio, contextvars, concurrent.futures, threading, atexit, os
+from typing import Any, Coroutine
+
+class Loops:
+
+    def __init__ ( self, size: int = 1 ):
+
+        self._size    = max(1, int(size))
+        self._loops   = []
+        self._threads = []
+        self._lock    = threading.Lock()
+        self._pid     = None
+        self._next    = 0
+
+    def _serve_ ( self, loop: asyncio.AbstractEventLoop, ready: threading.Event ):
+
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+
+        try: loop.run_forever()
+        finally:
+            try: loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception: pass
+            loop.close()
+
+    def _start_ ( self ):
+
+        with self._lock:
+
+            if self._pid == os.getpid() and self._loops: return self
+
+            self._loops, self._threads = [], []
+
+            for index in range(self._size):
+
+                loop, ready = asyncio.new_event_loop(), threading.Event()
+                thread = threading.Thread(target=self._serve_, args=(loop, ready), name=f"loop-{index}", daemon=True)
+
+                thread.start()
+                ready.wait()
+
+                self._loops.append(loop)
+                self._threads.append(thread)
+
+            self._pid = os.getpid()
+
+        return self
+
+    def _settle_ ( self, task: asyncio.Task, future: concurrent.futures.Future ):
+
+        if future.done(): return
+        if task.cancelled(): return future.cancel()
+
+        error = task.exception()
+
+        if error is not None: future.set_exception(error)
+        else: future.set_result(task.result())
+
+    def resize ( self, size: int ):
+
+        self.shutdown()
+        self._size = max(1, int(size))
+
+        return self
+
+    def loop ( self ):
+
+        if self._pid != os.getpid() or not self._loops: self._start_()
+
+        loop = self._loops[self._next % len(self._loops)]
+        self._next += 1
+
+        return loop
+
+    def owns ( self, loop: Any = None ):
+
+        if loop is None:
+            try: loop = asyncio.get_running_loop()
+            except RuntimeError: return False
+
+        return self._pid == os.getpid() and loop in self._loops
+
+    def submit ( self, coro: Coroutine ):
+
+        loop    = self.loop()
+        future  = concurrent.futures.Future()
+        context = contextvars.copy_context()
+
+        def start ():
+
+            if future.cancelled(): return coro.close()
+
+            task = loop.create_task(coro, context=context)
+            task.add_done_callback(lambda t: self._settle_(t, future))
+            future.add_done_callback(lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel))
+
+        loop.call_soon_threadsafe(start)
+        return future
+
+    def run ( self, coro: Coroutine, timeout: float = None ):
+
+        if self.owns(): return self.isolated(coro)
+        return self.submit(coro).result(timeout)
+
+    def isolated ( self, coro: Coroutine ):
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(contextvars.copy_context().run, asyncio.run, coro).result()
+
+    def shutdown ( self ):
+
+        with self._lock:
+
+            if self._pid == os.getpid():
+
+                for loop in self._loops:
+                    if not loop.is_closed(): loop.call_soon_threadsafe(loop.stop)
+
+                for thread in self._threads: thread.join(timeout=1)
+
+            self._loops, self._threads, self._pid = [], [], None
+
+        return self
+
+loops = Loops(int(os.environ.get("APP_LOOPS", 1)))
+atexit.register(loops.shutdown)
@@ -1,6 +1,7 @@
 from importlib import util
 from typing import Any
-import importlib, pkgutil, os, sys, types, re
+from concurrent.futures import ThreadPoolExecutor
+import importlib, pkgutil, os, sys, types, time, re
 
 class Modules:
 
@@ -31,6 +32,7 @@ class Modules:
             'public'         : 'public',
             'tests'          : 'tests',
             'storage'        : 'storage/public',
+            'cache'          : 'storage/cache',
             'logs'           : 'storage/logs',
             'views'          : 'resources/views',
             'docs'           : 'resources/docs',
@@ -130,6 +132,23 @@ class Modules:
 
         return found
 
+    def timed_require ( self, name: str, handle: bool = True ):
+
+        start = time.perf_counter()
+        mod = self.require(name, handle)
+
+        return mod, time.perf_counter() - start
+
+    def preload ( self, *paths, recursive: bool = False, workers: int = None ):
+
+        names = [name for name, info in self.discover(*paths, recursive=recursive).items() if not info['loaded']]
+        if not names: return {}
+
+        with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as pool:
+            results = list(pool.map(self.timed_require, names))
+
+        return { name: round(elapsed, 6) for name, (_, elapsed) in zip(names, results) }
+
     def smart_require ( self, name: str, variant_hint: str = None, handle: bool = True, reload: bool = False ):
 
         path = self.normalize(name)
@@ -1,5 +1,6 @@
 from multiprocessing import Queue, shared_memory
 from typing import Iterable, Callable, Any
+from ..micro.loop import loops
 import multiprocessing, asyncio, inspect, math, time, copy, threading, struct, pickle
 
 class Streamer:
@@ -37,7 +38,7 @@ class Process:
         self._items        = []
         self._context      = []
         self._processes    = []
-        self._threads      = []
+        self._futures      = []
         self._results      = []
         self._index_map    = []
         self._shared       = None
@@ -101,7 +102,7 @@ class Process:
         
         start = time.time()
        
-        while any(t.is_alive() for t in self._threads) and time.time() - start < self._timeout:
+        while any(not f.done() for f in self._futures) and time.time() - start < self._timeout:
             time.sleep(0.0001)
 
         return self
@@ -119,9 +120,7 @@ class Process:
         ref = getattr(self, f"_{type}_ref", None)
         if not ref: return
 
-        thread = threading.Thread(target=lambda: asyncio.run(ref.dispatch(data)), daemon=True)
-        thread.start()
-        self._threads.append(thread)
+        self._futures.append(loops.submit(ref.dispatch(data)))
 
     def _encode_ ( self, items: list ):
 
@@ -171,7 +170,7 @@ class Process:
 
         for _ in range(self._retries):
 
-            try: return asyncio.run(self._handler_ref.dispatch(item))
+            try: return loops.run(self._handler_ref.dispatch(item))
             except Exception as e: self._dispatch_('error', e)
 
     def worker ( self, indexes: list, queue: Queue, items: list ):
@@ -1,4 +1,5 @@
 from typing import Iterable, Callable, Any
+from ..micro.loop import loops
 import ray, asyncio, inspect, math, os, copy, threading
 
 @ray.remote
@@ -82,11 +83,13 @@ class Streamer:
 
     def call ( self, value: Any ):
 
+        if inspect.iscoroutinefunction(self.callback): return loops.submit(self.callback(value))
+
         def runner ():
             
             try:
                 result = self.callback(value)
-                if inspect.iscoroutine(result): asyncio.run(result)
+                if inspect.iscoroutine(result): loops.run(result)
             except: pass
 
         threading.Thread(target=runner, daemon=True).start()
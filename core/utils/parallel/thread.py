@@ -1,5 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Iterable, Callable, Any
+from ..micro.loop import loops
 import asyncio, inspect, threading, math, time, copy
 
 # class Thread:
@@ -143,13 +144,14 @@ class Thread:
         self._cancel_ref   = None
         self._complete_ref = None
         self._stop_flag    = threading.Event()
+        self._local        = threading.local()
 
     def _dispatch_ ( self, type: str, data: Any ):
 
         ref = getattr(self, f"_{type}_ref", None)
         if not ref: return
 
-        threading.Thread(target=lambda: asyncio.run(ref.dispatch(data)), daemon=True).start()
+        loops.submit(ref.dispatch(data))
 
     def _execute_ ( self, item: Any ):
 
@@ -161,8 +163,8 @@ class Thread:
 
                 result = self._handler(item, **self._context) if callable(self._handler) else self._handler
 
-                if inspect.iscoroutine(result): result = asyncio.run(result)
-                if inspect.iscoroutinefunction(result): result = asyncio.run(result())
+                if inspect.iscoroutine(result): result = self._runner_().run(result)
+                if inspect.iscoroutinefunction(result): result = self._runner_().run(result())
 
                 self._dispatch_('stream', result)
                 return result
@@ -173,14 +175,30 @@ class Thread:
 
         return None
 
+    def _runner_ ( self ):
+
+        runner = getattr(self._local, "runner", None)
+        if runner is None: runner = self._local.runner = asyncio.Runner()
+
+        return runner
+
     def _work_ ( self, items: list ):
 
         results = []
 
-        for item in items:
+        try:
+
+            for item in items:
+
+                if self._stop_flag.is_set(): break
+                results.append(self._execute_(item))
+
+        finally:
+
+            runner = getattr(self._local, "runner", None)
+            self._local.runner = None
 
-            if self._stop_flag.is_set(): break
-            results.append(self._execute_(item))
+            if runner is not None: runner.close()
 
         return results
 
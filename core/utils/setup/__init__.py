@@ -1,3 +1,4 @@
 from .compiler import Compiler
+from .arena import arena
 
 compiler = Compiler()
@@ -0,0 +1,244 @@
+from typing import Any
+import os, threading
+
+class Lease:
+
+    __slots__ = ("arena", "buf", "view", "size", "pooled")
+
+    def __init__ ( self, arena: "BufferArena", buf: bytearray, pooled: bool ):
+
+        self.arena  = arena
+        self.buf    = buf
+        self.view   = memoryview(buf)
+        self.size   = 0
+        self.pooled = pooled
+
+    def fits ( self, n: int ):
+
+        return self.size + n <= len(self.buf)
+
+    def write ( self, chunk: Any ):
+
+        n = len(chunk)
+        if not self.fits(n): return False
+
+        self.view[self.size:self.size + n] = chunk
+        self.size += n
+
+        return True
+
+    def data ( self ):
+
+        return self.view[:self.size]
+
+    def getvalue ( self ):
+
+        return bytes(self.view[:self.size])
+
+    def release ( self ):
+
+        if self.buf is None: return False
+
+        self.view.release()
+        buf, self.buf, self.view = self.buf, None, None
+
+        return self.arena.release(buf, self.pooled)
+
+    def __enter__ ( self ):
+
+        return self
+
+    def __exit__ ( self, *args ):
+
+        self.release()
+
+class BufferArena:
+
+    def __init__ ( self, slots: int = 256, size: int = 128 * 1024 ):
+
+        self.slots = slots
+        self.size  = size
+        self.lock  = threading.Lock()
+        self.pid   = None
+        self.free  = []
+        self.reset_stats()
+
+    def reset_stats ( self ):
+
+        self.hits      = 0
+        self.overflows = 0
+        self.bypassed  = 0
+        self.in_use    = 0
+        self.peak      = 0
+
+        return self
+
+    def configure ( self, slots: int = None, size: int = None ):
+
+        with self.lock:
+
+            self.slots = int(slots or self.slots)
+            self.size  = int(size or self.size)
+            self.pid   = None
+            self.free  = []
+
+        return self.allocate()
+
+    def allocate ( self ):
+
+        with self.lock:
+
+            if self.pid == os.getpid(): return self
+
+            self.pid  = os.getpid()
+            self.free = [bytearray(self.size) for _ in range(self.slots)]
+            self.reset_stats()
+
+        return self
+
+    def checkout ( self ):
+
+        if self.pid != os.getpid(): self.allocate()
+
+        with self.lock:
+
+            if not self.free:
+                self.overflows += 1
+                return None
+
+            self.in_use += 1
+            self.peak = max(self.peak, self.in_use)
+            self.hits += 1
+
+            return Lease(self, self.free.pop(), True)
+
+    def release ( self, buf: bytearray, pooled: bool ):
+
+        with self.lock:
+
+            self.in_use -= 1
+            if not pooled or len(self.free) >= self.slots: return False
+
+            self.free.append(buf)
+
+        return True
+
+    def bypass ( self ):
+
+        self.bypassed += 1
+        return self
+
+    def stats ( self ):
+
+        total = self.hits + self.overflows
+
+        return {
+            "pid"       : self.pid,
+            "slots"     : self.slots,
+            "size"      : self.size,
+            "free"      : len(self.free),
+            "in_use"    : self.in_use,
+            "peak"      : self.peak,
+            "hits"      : self.hits,
+            "overflows" : self.overflows,
+            "bypassed"  : self.bypassed,
+            "hit_rate"  : round(self.hits / total, 4) if total else 1.0,
+        }
+
+arena = BufferArena()
+
+def content_length ( headers: Any ):
+
+    for key, value in headers or ():
+        if key.lower() == b"content-length":
+            try: return int(value)
+            except ValueError: return None
+
+    return None
+
+def form_body ( headers: Any ):
+
+    for key, value in headers or ():
+        if key.lower() == b"content-type": return value.lower().startswith((b"multipart/form-data", b"application/x-www-form-urlencoded"))
+
+    return False
+
+class ArenaMiddleware:
+
+    def __init__ ( self, app: Any, arena: BufferArena = arena ):
+
+        self.app   = app
+        self.arena = arena
+
+    async def __call__ ( self, scope: dict, receive: Any, send: Any ):
+
+        if scope["type"] != "http": return await self.app(scope, receive, send)
+
+        headers = scope.get("headers")
+        length  = content_length(headers)
+
+        if length is not None and length > self.arena.size or form_body(headers):
+            self.arena.bypass()
+            return await self.app(scope, receive, send)
+
+        if length: receive = await self.buffer_request(receive)
+        await self.app(scope, receive, self.buffer_response(send))
+
+    async def buffer_request ( self, receive: Any ):
+
+        message = await receive()
+
+        if message["type"] != "http.request" or not message.get("more_body", False): extra = [message]
+        else: extra = await self.collect(message, receive)
+
+        async def replay ():
+
+            return extra.pop(0) if extra else await receive()
+
+        return replay
+
+    async def collect ( self, message: dict, receive: Any ):
+
+        # One immutable bytes body, so code that keeps a reference to it can
+        # never observe another request's data.
+        chunks = []
+
+        while True:
+
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False): return [{"type": "http.request", "body": b"".join(chunks), "more_body": False}]
+
+            message = await receive()
+            if message["type"] != "http.request": return [{"type": "http.request", "body": b"".join(chunks), "more_body": True}, message]
+
+    def buffer_response ( self, send: Any ):
+
+        state = {"buffer": False, "chunks": [], "size": 0}
+
+        async def sender ( message: dict ):
+
+            kind = message["type"]
+
+            if kind == "http.response.start":
+                length = content_length(message.get("headers"))
+                state["buffer"] = length is not None and length <= self.arena.size
+                return await send(message)
+
+            if kind != "http.response.body" or not state["buffer"]: return await send(message)
+
+            body, more = message.get("body", b""), message.get("more_body", False)
+
+            if not more and not state["chunks"]: return await send(message)
+
+            state["chunks"].append(body)
+            state["size"] += len(body)
+
+            if state["size"] > self.arena.size:
+                state["buffer"] = False
+                return await send({"type": kind, "body": b"".join(state["chunks"]), "more_body": more})
+
+            if more: return None
+
+            await send({"type": kind, "body": b"".join(state["chunks"]), "more_body": False})
+
+        return sender
@@ -0,0 +1,139 @@
+from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+import asyncio, socket, time, subprocess
+
+async def read_response ( reader: asyncio.StreamReader ):
+
+    head   = await reader.readuntil(b"\r\n\r\n")
+    lines  = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    length, chunked, close = 0, False, False
+
+    for line in lines[1:]:
+
+        key, _, value = line.partition(":")
+        key, value = key.strip().lower(), value.strip().lower()
+
+        if key == "content-length": length = int(value)
+        elif key == "transfer-encoding": chunked = "chunked" in value
+        elif key == "connection": close = value == "close"
+
+    if chunked:
+
+        while True:
+
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0: break
+
+    elif length: await reader.readexactly(length)
+
+    return status, close
+
+async def connection ( host: str, port: int, request: bytes, deadline: float, stats: dict ):
+
+    reader, writer = None, None
+
+    while time.perf_counter() < deadline:
+
+        try:
+
+            if writer is None: reader, writer = await asyncio.open_connection(host, port)
+
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            status, close = await read_response(reader)
+
+            stats["latency"].append(time.perf_counter() - start)
+            stats["status"][status] = stats["status"].get(status, 0) + 1
+
+            if not 200 <= status < 300: stats["errors"] += 1
+
+            if close:
+                writer.close()
+                writer = None
+
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+
+            stats["errors"] += 1
+            if writer is not None: writer.close()
+            writer = None
+
+            await asyncio.sleep(0.001)
+
+    if writer is not None: writer.close()
+
+async def arun ( host: str, port: int, path: str = "/", connections: int = 128, duration: float = 3 ):
+
+    stats    = {"latency": [], "status": {}, "errors": 0}
+    request  = f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: keep-alive\r\n\r\n".encode()
+    started  = time.perf_counter()
+
+    await asyncio.gather(*[connection(host, port, request, started + duration, stats) for _ in range(connections)])
+
+    stats["elapsed"] = time.perf_counter() - started
+    return stats
+
+def drive ( host: str, port: int, path: str, connections: int, duration: float, begin: float = 0 ):
+
+    time.sleep(max(0.0, begin - time.time()))
+    return asyncio.run(arun(host, port, path, connections, duration))
+
+def summary ( parts: list ):
+
+    latency = sorted(x for part in parts for x in part["latency"])
+    elapsed = max(part["elapsed"] for part in parts)
+    status  = {}
+
+    for part in parts:
+        for code, count in part["status"].items(): status[code] = status.get(code, 0) + count
+
+    return {
+        "rps"    : round(len(latency) / elapsed, 1) if elapsed else 0.0,
+        "p99_us" : round(latency[min(len(latency) - 1, int(0.99 * len(latency)))] * 1e6, 1) if latency else 0.0,
+        "errors" : sum(part["errors"] for part in parts),
+        "status" : { str(k): v for k, v in sorted(status.items()) },
+    }
+
+def run ( host: str, port: int, path: str = "/", connections: int = 128, duration: float = 3, processes: int = 1 ):
+
+    # One asyncio client tops out long before a multi-worker server does, so
+    # the connections are spread over several client processes.
+    processes = max(1, min(int(processes or 1), connections))
+    if processes == 1: return summary([drive(host, port, path, connections, duration)])
+
+    shares = [connections // processes + (1 if i < connections % processes else 0) for i in range(processes)]
+    begin  = time.time() + 0.25
+
+    with ProcessPoolExecutor(processes) as pool:
+        parts = list(pool.map(drive, *zip(*[(host, port, path, share, duration, begin) for share in shares])))
+
+    return summary(parts)
+
+def wait ( host: str, port: int, process: Any, timeout: float = 30 ):
+
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+
+        if process.poll() is not None: raise RuntimeError(f"Server exited with code {process.returncode}")
+
+        try:
+            with socket.create_connection((host, port), timeout=0.5): return True
+        except OSError:
+            time.sleep(0.1)
+
+    raise TimeoutError(f"Server not ready on {host}:{port} after {timeout}s")
+
+def stop ( process: Any, timeout: float = 10 ):
+
+    if process.poll() is not None: return process.returncode
+
+    process.terminate()
+
+    try: return process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        return process.wait()
@@ -1,93 +1,18 @@
-import os, sys, psutil, asyncio, uvicorn, orjson, multiprocessing
+from .arena import arena, ArenaMiddleware
+from .tune import resolve, defaults
+from uvicorn.importer import import_from_string
+from typing import Any
+import os, sys, psutil, asyncio, uvicorn, multiprocessing
 
-_CONTEXT = []
 _HEATERS = []
-_PTR     = 0
 
-def _alloc_context ( size ):
+def get_context ():
 
-    global _CONTEXT
+    return arena.checkout()
 
-    for _ in range(size):
-        _CONTEXT.append({ "scope": None, "receive": None, "send": None, "buf": bytearray(1024 * 128), "resp": bytearray(1024 * 128)})
+def arena_app ():
 
-    return True
-
-def get_context():
-
-    global _PTR
-
-    ctx = _CONTEXT[_PTR]
-    _PTR = (_PTR + 1) % len(_CONTEXT)
-
-    return ctx
-
-class _JSON:
-
-    __slots__ = ("v",)
-
-    def __init__ ( self, v ):
-
-        self.v = v
-
-    def render ( self ):
-
-        return orjson.dumps(self.v, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
-
-class _Ring:
-
-    __slots__ = ("buf", "n", "p")
-
-    def __init__ ( self, size ):
-
-        self.buf = [None] * size
-        self.n = size
-        self.p = 0
-
-    def push ( self, x ):
-
-        self.buf[self.p] = x
-        self.p = (self.p + 1) % self.n
-
-    def next ( self ):
-
-        x = self.buf[self.p]
-        self.p = (self.p + 1) % self.n
-
-        return x
-
-def _coroutine_ring ( size ):
-
-    r = _Ring(size)
-
-    async def w():
-        while True:
-            await asyncio.sleep(0)
-
-    for _ in range(size):
-        r.push(w())
-
-    return r
-
-def _scheduler ():
-
-    q = []
-    loop = asyncio.get_event_loop()
-
-    async def pump():
-        while True:
-            if q:
-                fn = q.pop()
-                try: fn()
-                except: pass
-            await asyncio.sleep(0)
-
-    loop.create_task(pump())
-
-    def submit(fn):
-        q.append(fn)
-
-    return submit
+    return ArenaMiddleware(import_from_string(os.environ["APP_ARENA_TARGET"]))
 
 def _cpu_affinity ():
 
@@ -127,28 +52,52 @@ def boot ( *fns ):
 
     return True
 
-def runtime ():
+def runtime ( slots: int = 256, size: int = 1024 * 128 ):
 
-    _alloc_context(256)
+    arena.configure(slots, size)
     _cpu_affinity()
     _event_loop()
-    _coroutine_ring(128)
-    _scheduler()
     _run_boot()
 
     return True
 
-def startup ( app, host="0.0.0.0", port=8000, workers: int = None, reload: bool = False ):
+def preload_app ( app ):
+
+    if isinstance(app, str): app = import_from_string(app)
+    runtime()
+
+    return app
+
+def startup ( app, host="0.0.0.0", port=8000, workers: int = None, reload: bool = False, backlog: int = None, tune: Any = None, preload: bool = False ):
+
+    tuned = resolve(app, os.environ.get("APP_TUNE", False) if tune is None else tune)
+
+    if preload and not reload:
+
+        from core.bootstrap.workers import serve
+
+        return serve(
+            ArenaMiddleware(preload_app(app)),
+            host=host,
+            port=port,
+            workers=workers or (tuned["workers"] if isinstance(app, str) else defaults()["workers"]),
+            backlog=backlog or tuned["backlog"],
+            loop=tuned["loop"],
+            http=tuned["http"],
+        )
 
     runtime()
 
+    if isinstance(app, str): os.environ["APP_ARENA_TARGET"] = app
+
     uvicorn.run(
-        app,
+        f"{__name__}:arena_app" if isinstance(app, str) else ArenaMiddleware(app),
+        factory=isinstance(app, str),
         host=host,
         port=port,
-        loop="uvloop",
-        http="httptools",
-        backlog=4096,
-        workers=workers or max(1, multiprocessing.cpu_count() // 2),
+        loop=tuned["loop"],
+        http=tuned["http"],
+        backlog=backlog or tuned["backlog"],
+        workers=workers or tuned["workers"],
         reload=reload
     )
@@ -0,0 +1,146 @@
+from typing import Any
+from . import probe as loader
+import os, sys, json, time, socket, platform, importlib.util, subprocess
+
+PROFILE = os.environ.get("APP_TUNE_FILE", "storage/cache/runtime.json")
+
+def cpu_quota ():
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f: quota, period = f.read().split()[:2]
+        if quota != "max": return max(1, int(int(quota) / int(period)))
+    except (OSError, ValueError): pass
+
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f: quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f: period = int(f.read())
+        if quota > 0: return max(1, quota // period)
+    except (OSError, ValueError): pass
+
+    try: return len(os.sched_getaffinity(0))
+    except AttributeError: return os.cpu_count() or 1
+
+def has ( name: str ):
+
+    return importlib.util.find_spec(name) is not None
+
+def defaults ( cpus: int = None ):
+
+    cpus = cpus or cpu_quota()
+
+    return {
+        "workers" : max(1, cpus // 2),
+        "backlog" : 2048,
+        "loop"    : "uvloop" if has("uvloop") else "auto",
+        "http"    : "httptools" if has("httptools") else "auto",
+    }
+
+def fingerprint ( app: str ):
+
+    return f"{app}|{platform.machine()}|{platform.python_version()}|{cpu_quota()}"
+
+def candidates ( cpus: int = None ):
+
+    cpus = cpus or cpu_quota()
+    return sorted({1, max(1, cpus // 2), cpus, cpus * 2})
+
+def free_port ( host: str = "127.0.0.1" ):
+
+    with socket.socket() as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+def probe ( app: str, workers: int, backlog: int, loop: str, http: str, path: str = "/", connections: int = 128, duration: float = 3, warmup: float = 1, processes: int = None ):
+
+    host, port = "127.0.0.1", free_port()
+    clients    = processes or min(workers, cpu_quota())
+
+    command = [
+        sys.executable, "-m", "uvicorn", app,
+        "--host", host, "--port", str(port),
+        "--workers", str(workers), "--backlog", str(backlog),
+        "--loop", loop, "--http", http,
+        "--log-level", "warning", "--no-access-log",
+    ]
+
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+
+    try:
+        loader.wait(host, port, process)
+        if warmup: loader.run(host, port, path, connections=connections, duration=warmup, processes=clients)
+
+        result = loader.run(host, port, path, connections=connections, duration=duration, processes=clients)
+
+    finally:
+        loader.stop(process)
+
+    return {"workers": workers, "backlog": backlog, "clients": clients, **result}
+
+def choose ( results: list, tolerance: float = 0.05 ):
+
+    clean = [r for r in results if not r["errors"] and r["rps"]] or [r for r in results if r["rps"]]
+    if not clean: return None
+
+    best = max(r["rps"] for r in clean)
+    near = [r for r in clean if r["rps"] >= best * (1 - tolerance)]
+
+    return min(near, key=lambda r: (r["p99_us"], r["workers"]))
+
+def load ( app: str, path: str = None ):
+
+    try:
+        with open(path or PROFILE, "r", encoding="utf-8") as f: data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return data.get("config") if data.get("fingerprint") == fingerprint(app) else None
+
+def save ( app: str, config: dict, results: list, path: str = None ):
+
+    path = path or PROFILE
+    data = {"fingerprint": fingerprint(app), "tuned_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "config": config, "results": results}
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    with open(path + ".tmp", "w", encoding="utf-8") as f: json.dump(data, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+    return data
+
+def autotune ( app: str, path: str = "/", profile: str = None, backlogs: tuple = (1024, 2048, 4096), **options: Any ):
+
+    base    = defaults()
+    results = []
+
+    def attempt ( workers: int, backlog: int ):
+
+        try: results.append(probe(app, workers, backlog, base["loop"], base["http"], path, **options))
+        except Exception as e: results.append({"workers": workers, "backlog": backlog, "rps": 0.0, "p99_us": 0.0, "errors": 1, "error": str(e)})
+
+        print(f"tune workers={workers:<3} backlog={backlog:<5} {results[-1]['rps']:>10,.1f} req/s  p99 {results[-1]['p99_us']:>10,.1f}us", file=sys.stderr)
+
+    # Workers first at the default backlog, then only the winner's backlog:
+    # at most len(candidates) + len(backlogs) - 1 probes instead of the product.
+    for workers in candidates(): attempt(workers, base["backlog"])
+
+    best = choose(results)
+
+    if best:
+        for backlog in backlogs:
+            if backlog != base["backlog"]: attempt(best["workers"], backlog)
+
+    best   = choose(results)
+    config = {**base, "workers": best["workers"], "backlog": best["backlog"]} if best else base
+
+    save(app, config, results, profile)
+    return config
+
+def resolve ( app: Any, tune: bool = False, path: str = "/", profile: str = None, **options: Any ):
+
+    if not isinstance(app, str): return {**defaults(), "workers": 1}
+    if tune == "force": return autotune(app, path, profile, **options)
+
+    config = load(app, profile)
+    if config: return config
+
+    return autotune(app, path, profile, **options) if tune in (True, "1", "true", "auto") else defaults()